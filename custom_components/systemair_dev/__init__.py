@@ -7,15 +7,25 @@ https://github.com/tesharp/systemair-save-connect
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_IP_ADDRESS, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
-from .api import SystemairApiClient
+from .api import SystemairApiClient, create_gateway_session
+from .const import (
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_EXTRA_REGISTERS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+)
 from .coordinator import SystemairDataUpdateCoordinator
 from .data import SystemairData
+from .modbus import REQUIRED_PARAMETERS, parameter_map
+from .storage import get_snapshot_store
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -37,20 +47,36 @@ async def async_setup_entry(
     entry: SystemairConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    interval_range = None
+    if entry.options.get(CONF_ADAPTIVE_INTERVAL):
+        interval_range = (
+            timedelta(seconds=entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)),
+            timedelta(seconds=entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)),
+        )
     coordinator = SystemairDataUpdateCoordinator(
         hass=hass,
+        interval_range=interval_range,
     )
+    session = create_gateway_session()
+    entry.async_on_unload(session.close)
     entry.runtime_data = SystemairData(
         client=SystemairApiClient(
             address=entry.data[CONF_IP_ADDRESS],
-            session=async_get_clientsession(hass),
+            session=session,
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    coordinator.register_modbus_parameters(
+        *REQUIRED_PARAMETERS,
+        *(parameter_map[short] for short in entry.options.get(CONF_EXTRA_REGISTERS, ()) if short in parameter_map),
+    )
+
+    # Entities come up from the last saved snapshot while the first live read runs in the background
+    if not await coordinator.async_config_entry_restore():
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -66,10 +92,17 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: SystemairConfigEntry,
+) -> None:
+    """Remove the stored snapshot of a deleted entry."""
+    await get_snapshot_store(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: SystemairConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
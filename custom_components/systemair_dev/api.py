@@ -2,17 +2,49 @@
 
 from __future__ import annotations
 
-import asyncio.exceptions
+import asyncio
 import socket
+import time
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import async_timeout
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .const import LOGGER
+from .modbus import parameter_map
+from .planner import DEFAULT_MAX_GAP, DEFAULT_MAX_URL_LENGTH, build_read_plan
+from .resilience import (
+    READ_RETRY_POLICY,
+    WRITE_RETRY_POLICY,
+    CircuitBreaker,
+    CircuitState,
+    LatencyTracker,
+    RetryPolicy,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from .modbus import ModbusParameter
+    from .planner import ReadPlan
+
+DEFAULT_REQUEST_RATE = 4.0
+DEFAULT_REQUEST_BURST = 4
+# Seconds an idle connection to the gateway is kept open, and resolved hostnames are cached
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+# Number of distinct register sets whose compiled read request is kept
+READ_REQUEST_CACHE_SIZE = 32
+# Registers read per request while discovering the registers a unit supports
+PROBE_BATCH_SIZE = 25
+# Register read to check whether an open circuit can be closed again
+PROBE_PARAMETER = parameter_map["REG_USERMODE_MODE"]
 
 
 class SystemairApiClientError(Exception):
@@ -25,17 +57,86 @@ class SystemairApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class SystemairApiClientCircuitOpenError(
+    SystemairApiClientCommunicationError,
+):
+    """Exception to indicate the gateway is not contacted because its circuit is open."""
+
+
+def create_gateway_session() -> aiohttp.ClientSession:
+    """
+    Create a session with a single kept alive connection to a gateway.
+
+    The gateway serves one Modbus request at a time, so further requests wait for the connection
+    instead of opening their own.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=1,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        ),
+    )
+
+
+class _TokenBucket:
+    """Token bucket limiting the request rate towards a gateway."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
 class SystemairApiClient:
     """Systemair API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         address: str,
         session: aiohttp.ClientSession,
+        *,
+        max_gap: int = DEFAULT_MAX_GAP,
+        request_rate: float = DEFAULT_REQUEST_RATE,
+        request_burst: int = DEFAULT_REQUEST_BURST,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_chunk_registers: int | None = None,
+        max_concurrent_chunks: int = 1,
     ) -> None:
-        """Systemair API Client."""
+        """
+        Systemair API Client.
+
+        Reads that would exceed max_url_length or max_chunk_registers are split into chunks,
+        sent back to back or, with max_concurrent_chunks above one, partly in parallel.
+        """
         self._address = address
         self._session = session
+        self._max_gap = max_gap
+        self._unavailable_addresses: frozenset[int] = frozenset()
+        self._max_url_length = max_url_length
+        self._max_chunk_registers = max_chunk_registers
+        self._chunk_semaphore = asyncio.Semaphore(max_concurrent_chunks)
+        self._rate_limiter = _TokenBucket(request_rate, request_burst)
+        self._inflight_reads: dict[frozenset[int], asyncio.Task[dict[str, Any]]] = {}
+        self._read_requests: dict[frozenset[int], tuple[tuple[ReadPlan, str], ...]] = {}
+        self.circuit_breaker = CircuitBreaker()
+        self.latency = LatencyTracker()
+        self._probe_lock = asyncio.Lock()
+        # Requests wait here for the single gateway connection, so the wait is not timed with the request
+        self._request_lock = asyncio.Lock()
 
     async def async_test_connection(self) -> Any:
         """Test connection to API."""
@@ -45,24 +146,146 @@ class SystemairApiClient:
         """Get information from the API."""
         return await self._api_wrapper(method="get", url=f"http://{self._address}/{endpoint}")
 
-    async def async_get_data(self, reg: list[ModbusParameter]) -> Any:
-        """Read modbus registers."""
-        query_params = ",".join(f"%22{item.register - 1}%22:1" for item in reg)
-        url = f"http://{self._address}/mread?{{{query_params}}}"
-        LOGGER.debug("URL: %s", url)
-        return await self._api_wrapper(method="get", url=url)
+    async def async_get_data(self, reg: Iterable[ModbusParameter]) -> dict[str, Any]:
+        """
+        Read modbus registers.
+
+        Registers that are already being read by a request in flight are taken from that
+        request, only the remaining registers are sent to the gateway.
+        """
+        reg = list(reg)
+        wanted = frozenset(item.register - 1 for item in reg)
+        overlapping = {
+            addresses: task for addresses, task in self._inflight_reads.items() if not addresses.isdisjoint(wanted)
+        }
+        shared = list(overlapping.values())
+        covered = frozenset().union(*overlapping)
+        missing = [item for item in reg if item.register - 1 not in covered]
+        if missing:
+            shared.append(self._start_read(missing))
+
+        data: dict[str, Any] = {}
+        for task in shared:
+            data.update(await asyncio.shield(task))
+        return {key: value for key, value in data.items() if int(key) in wanted}
+
+    def _start_read(self, reg: list[ModbusParameter]) -> asyncio.Task[dict[str, Any]]:
+        """Start a read that concurrent callers can share."""
+        addresses = frozenset(item.register - 1 for item in reg)
+        task = asyncio.get_running_loop().create_task(self._async_read(reg, addresses))
+        self._inflight_reads[addresses] = task
+
+        def _done(task: asyncio.Task[dict[str, Any]]) -> None:
+            self._inflight_reads.pop(addresses, None)
+            # Mark the exception as retrieved, the callers awaiting the read handle it
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _async_read(self, reg: list[ModbusParameter], addresses: frozenset[int]) -> dict[str, Any]:
+        """
+        Read modbus registers, merging nearby registers into range reads.
+
+        When the read is split into chunks the registers of failed chunks are left out of the
+        result, the read only fails when every chunk failed.
+        """
+        requests = self._read_request(reg, addresses)
+        if len(requests) == 1:
+            plan, url = requests[0]
+            return plan.split(await self._api_wrapper(method="get", url=url))
+
+        results = await asyncio.gather(
+            *(self._async_read_chunk(plan, url) for plan, url in requests),
+            return_exceptions=True,
+        )
+        data: dict[str, Any] = {}
+        errors: list[SystemairApiClientError] = []
+        for result in results:
+            if isinstance(result, SystemairApiClientError):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                data.update(result)
+        if errors:
+            if not data:
+                raise errors[0]
+            LOGGER.warning("%d of %d read chunks failed: %s", len(errors), len(requests), errors[0])
+        return data
+
+    async def _async_read_chunk(self, plan: ReadPlan, url: str) -> dict[str, Any]:
+        """Read a single chunk of a split read."""
+        async with self._chunk_semaphore:
+            return plan.split(await self._api_wrapper(method="get", url=url))
+
+    def set_unavailable_addresses(self, addresses: frozenset[int]) -> None:
+        """Set the addresses the unit does not implement, reads never bridge a gap across them."""
+        if addresses != self._unavailable_addresses:
+            self._unavailable_addresses = addresses
+            self._read_requests.clear()
+
+    def _read_request(
+        self,
+        reg: list[ModbusParameter],
+        addresses: frozenset[int],
+    ) -> tuple[tuple[ReadPlan, str], ...]:
+        """Return the read plans and urls of a register set, compiled on the first read of the set."""
+        if (requests := self._read_requests.get(addresses)) is None:
+            base_url = f"http://{self._address}/mread?{{}}"
+            plans = build_read_plan(reg, max_gap=self._max_gap, unavailable=self._unavailable_addresses).chunk(
+                max_query_length=self._max_url_length - len(base_url),
+                max_registers=self._max_chunk_registers,
+            )
+            requests = tuple((plan, f"http://{self._address}/mread?{{{plan.query}}}") for plan in plans)
+            LOGGER.debug(
+                "Compiled read request for %d registers: %s",
+                len(addresses),
+                " ".join(url for _, url in requests),
+            )
+            if len(self._read_requests) >= READ_REQUEST_CACHE_SIZE:
+                del self._read_requests[next(iter(self._read_requests))]
+            self._read_requests[addresses] = requests
+        return requests
+
+    async def async_probe_registers(self, reg: Iterable[ModbusParameter]) -> frozenset[int]:
+        """
+        Return the addresses of the given registers that the unit answers with a value.
+
+        Every register is requested on its own so a register the unit does not have cannot
+        hide its neighbours, PROBE_BATCH_SIZE registers are read per request.
+        """
+        supported: set[int] = set()
+        for batch in batched(sorted({item.register - 1 for item in reg}), PROBE_BATCH_SIZE):
+            query = ",".join(f"%22{address}%22:1" for address in batch)
+            response = await self._api_wrapper(method="get", url=f"http://{self._address}/mread?{{{query}}}")
+            supported.update(address for address in batch if response.get(str(address)) is not None)
+        return frozenset(supported)
 
     async def async_set_data(self, registry: ModbusParameter, value: int) -> Any:
         """Write data to the API."""
-        query_params = f"%22{registry.register - 1}%22:{value}"
+        return await self.async_set_registers({registry: value})
+
+    async def async_set_registers(self, values: Mapping[ModbusParameter, int]) -> Any:
+        """Write several registers with a single mwrite request."""
+        query_params = ",".join(f"%22{registry.register - 1}%22:{value}" for registry, value in values.items())
         url = f"http://{self._address}/mwrite?{{{query_params}}}"
         LOGGER.debug("URL: %s", url)
-        return await self._api_wrapper(method="get", url=url)
+        return await self._api_wrapper(method="get", url=url, retry_policy=WRITE_RETRY_POLICY)
 
     async def _parse_response(self, response: aiohttp.ClientResponse, *, retry: bool) -> Any:
-        """Parse the response."""
-        response_body = await response.text()
-        if "MB DISCONNECTED" in response_body:
+        """
+        Parse the response.
+
+        Read payloads are JSON objects and decoded straight from the body bytes, anything else is
+        a plain text status: the OK acknowledging a write or MB DISCONNECTED.
+        """
+        response_body = (await response.read()).strip()
+        if response_body[:1] in (b"{", b"["):
+            return json_loads(response_body)
+
+        if response_body.startswith(b"MB DISCONNECTED"):
             LOGGER.debug("Received 'MB DISCONNECTED', retrying...")
 
             if not retry:
@@ -71,46 +294,123 @@ class SystemairApiClient:
                     msg,
                 )
 
-            await asyncio.sleep(1)
             return None
-        if "OK" in response_body:
-            return response_body
-        return await response.json()
+        if response_body.startswith(b"OK"):
+            return response_body.decode()
 
-    async def _api_wrapper(
+        msg = f"Unexpected response - {response_body[:100]!r}"
+        raise SystemairApiClientError(
+            msg,
+        )
+
+    async def _async_request(
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        *,
+        retry: bool,
     ) -> Any:
-        """Get information from the API."""
-        retries = 3
-        try:
-            for attempt in range(retries):
-                async with async_timeout.timeout(10):
+        """
+        Send a single request with a timeout derived from the measured latency and parse the response.
+
+        The timeout and the recorded latency start once the request has the gateway connection, time
+        spent queued behind other requests would otherwise inflate both.
+        """
+        async with self._request_lock:
+            started = time.monotonic()
+            try:
+                async with async_timeout.timeout(self.latency.timeout):
                     response = await self._session.request(
                         method=method,
                         url=url,
                         headers=headers,
                         json=data,
                     )
-                    response = await self._parse_response(response, retry=attempt < retries - 1)
-                    if response is None:
-                        continue
-                    return response
+                    parsed = await self._parse_response(response, retry=retry)
+            except TimeoutError:
+                self.latency.record(time.monotonic() - started)
+                raise
+            # Only round trips and timeouts are recorded, failed connections would pull the timeout down
+            self.latency.record(time.monotonic() - started)
+            return parsed
+
+    async def _async_check_circuit(self) -> None:
+        """Raise while the circuit is open, probe the gateway with a single register read once a probe is due."""
+        breaker = self.circuit_breaker
+        if breaker.state is CircuitState.Closed:
+            return
+
+        async with self._probe_lock:
+            # Another request may have probed while waiting for the lock
+            if breaker.state is CircuitState.Closed:
+                return
+            if not breaker.probe_due:
+                msg = f"Gateway unavailable, next attempt in {breaker.retry_in:.0f}s"
+                raise SystemairApiClientCircuitOpenError(msg)
+
+            breaker.half_open()
+            url = f"http://{self._address}/mread?{{%22{PROBE_PARAMETER.register - 1}%22:1}}"
+            try:
+                await self._rate_limiter.acquire()
+                await self._async_request("get", url, retry=False)
+            except (TimeoutError, aiohttp.ClientError, socket.gaierror, SystemairApiClientError) as exception:
+                breaker.record_failure()
+                LOGGER.debug("Probe failed, circuit open for %.0fs: %s", breaker.open_duration, exception)
+                msg = f"Gateway unavailable, probe failed - {exception}"
+                raise SystemairApiClientCircuitOpenError(msg) from exception
+            breaker.record_success()
+            LOGGER.debug("Probe succeeded, circuit closed")
+
+    async def _api_wrapper(
+        self,
+        method: str,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+        *,
+        retry_policy: RetryPolicy = READ_RETRY_POLICY,
+    ) -> Any:
+        """Get information from the API."""
+        await self._async_check_circuit()
+
+        retries = retry_policy.attempts
+        try:
+            for attempt in range(retries):
+                if attempt:
+                    await asyncio.sleep(retry_policy.delay(attempt))
+                await self._rate_limiter.acquire()
+                last_attempt = attempt == retries - 1
+                try:
+                    response = await self._async_request(
+                        method, url, data=data, headers=headers, retry=not last_attempt
+                    )
+                except (TimeoutError, aiohttp.ClientError) as exception:
+                    # Transient failures use the same attempts as MB DISCONNECTED, the last one is raised below
+                    if last_attempt:
+                        raise
+                    LOGGER.debug("Request to %s failed, retrying: %s", self._address, exception)
+                    continue
+                if response is None:
+                    continue
+                self.circuit_breaker.record_success()
+                return response
 
         except TimeoutError as exception:
+            self.circuit_breaker.record_failure()
             msg = f"Timeout error fetching information - {exception}"
             raise SystemairApiClientCommunicationError(
                 msg,
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self.circuit_breaker.record_failure()
             msg = f"Error fetching information - {exception}"
             raise SystemairApiClientCommunicationError(
                 msg,
             ) from exception
         except SystemairApiClientCommunicationError as exception:
+            self.circuit_breaker.record_failure()
             msg = f"Received mb disconnect - {exception}"
             raise SystemairApiClientError(
                 msg,
@@ -11,8 +11,8 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 
-from .entity import SystemairEntity
-from .modbus import ModbusParameter, parameter_map
+from .entity import SystemairEntity, SystemairEntityDescription
+from .modbus import parameter_map
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,11 +23,9 @@ if TYPE_CHECKING:
 
 
 @dataclass(kw_only=True, frozen=True)
-class SystemairBinarySensorEntityDescription(BinarySensorEntityDescription):
+class SystemairBinarySensorEntityDescription(BinarySensorEntityDescription, SystemairEntityDescription):
     """Describes a Systemair binary sensor entity."""
 
-    registry: ModbusParameter
-
 
 ENTITY_DESCRIPTIONS = (
     SystemairBinarySensorEntityDescription(
@@ -51,12 +49,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
+    entry.runtime_data.coordinator.register_modbus_parameters(
+        *(param for entity_description in ENTITY_DESCRIPTIONS for param in entity_description.registries)
+    )
     async_add_entities(
         SystemairBinarySensor(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
         for entity_description in ENTITY_DESCRIPTIONS
+        if entry.runtime_data.coordinator.supports_parameters(entity_description.registry)
     )
 
 
@@ -76,6 +78,7 @@ class SystemairBinarySensor(SystemairEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{entity_description.key}"
+        self._registers = frozenset(param.short for param in entity_description.registries)
 
     @property
     def is_on(self) -> bool:
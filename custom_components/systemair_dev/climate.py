@@ -56,6 +56,22 @@ FAN_MODE_TO_VALUE_MAP = {
 
 VALUE_TO_FAN_MODE_MAP = {value: key for key, value in FAN_MODE_TO_VALUE_MAP.items()}
 
+# Registers the climate entity is derived from
+CLIMATE_PARAMETERS = tuple(
+    parameter_map[short]
+    for short in [
+        "REG_FUNCTION_ACTIVE_HEATER",
+        "REG_FUNCTION_ACTIVE_COOLER",
+        "REG_OUTPUT_TRIAC",
+        "REG_OUTPUT_Y3_DIGITAL",
+        "REG_SENSOR_RHS_PDM",
+        "REG_SENSOR_SAT",
+        "REG_TC_SP",
+        "REG_USERMODE_MODE",
+        "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF",
+    ]
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -63,6 +79,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Systemair unit."""
+    config_entry.runtime_data.coordinator.register_modbus_parameters(*CLIMATE_PARAMETERS)
     async_add_entities([SystemairClimateEntity(config_entry.runtime_data.coordinator)])
 
 
@@ -98,6 +115,7 @@ class SystemairClimateEntity(SystemairEntity, ClimateEntity):
     _attr_max_temp = MAX_TEMP
     _attr_min_temp = MIN_TEMP
     _enable_turn_on_off_backwards_compatibility = False
+    _registers = frozenset(param.short for param in CLIMATE_PARAMETERS)
 
     def __init__(self, coordinator: SystemairDataUpdateCoordinator) -> None:
         """Initialize the Systemair unit."""
@@ -152,8 +170,6 @@ class SystemairClimateEntity(SystemairEntity, ClimateEntity):
             await self.coordinator.set_modbus_data(parameter_map["REG_TC_SP"], temperature)
         except (asyncio.exceptions.TimeoutError, ConnectionError, DecodingError) as exc:
             raise HomeAssistantError from exc
-        finally:
-            await self.coordinator.async_refresh()
 
     @property
     def preset_mode(self) -> str:
@@ -173,9 +189,13 @@ class SystemairClimateEntity(SystemairEntity, ClimateEntity):
             await self.coordinator.set_modbus_data(parameter_map["REG_USERMODE_HMI_CHANGE_REQUEST"], ventilation_mode)
         except (asyncio.exceptions.TimeoutError, ConnectionError, DecodingError) as exc:
             raise HomeAssistantError from exc
-        finally:
-            await asyncio.sleep(2)
-            await self.coordinator.async_refresh()
+
+        # The unit takes a moment to switch mode after the change request, user modes are one lower than requests
+        await self.coordinator.async_wait_for_register(
+            parameter_map["REG_USERMODE_MODE"],
+            ventilation_mode - 1,
+            extra=(parameter_map["REG_USERMODE_REMAINING_TIME_L"], parameter_map["REG_USERMODE_REMAINING_TIME_H"]),
+        )
 
     @property
     def hvac_mode(self) -> HVACMode:
@@ -209,5 +229,3 @@ class SystemairClimateEntity(SystemairEntity, ClimateEntity):
             await self.coordinator.set_modbus_data(parameter_map["REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF"], mode)
         except (asyncio.exceptions.TimeoutError, ConnectionError) as exc:
             raise HomeAssistantError from exc
-        finally:
-            await self.coordinator.async_refresh()
@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.const import CONF_IP_ADDRESS, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import (
     SystemairApiClient,
     SystemairApiClientCommunicationError,
     SystemairApiClientError,
+    create_gateway_session,
+)
+from .const import (
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_EXTRA_REGISTERS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    LOGGER,
 )
-from .const import DOMAIN, LOGGER
+from .modbus import REQUIRED_PARAMETERS, category_map
+from .storage import get_device_metadata_store
 
 
 class SystemairFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -21,6 +35,14 @@ class SystemairFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SystemairOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return SystemairOptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -65,15 +87,84 @@ class SystemairFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, address: str) -> dict[str, str]:
         """Validate credentials."""
-        client = SystemairApiClient(
-            address=address,
-            session=async_create_clientsession(self.hass),
-        )
-        menu = await client.async_get_endpoint("menu")
-        unit_version = await client.async_get_endpoint("unit_version")
+        async with create_gateway_session() as session:
+            client = SystemairApiClient(
+                address=address,
+                session=session,
+            )
+            menu, unit_version = await asyncio.gather(
+                client.async_get_endpoint("menu"),
+                client.async_get_endpoint("unit_version"),
+            )
+        # Seed the metadata cache so the first setup of the entry does not fetch it again
+        await get_device_metadata_store(self.hass).async_set(menu, unit_version)
 
         response = {}
         response["mac_address"] = menu["mac"]
         response["model"] = unit_version["MB Model"]
 
         return response
+
+
+class SystemairOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
+    """Options flow for Systemair."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Manage the update interval and extra register options."""
+        _errors = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_MAX_INTERVAL]:
+                _errors["base"] = "invalid_interval_range"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        interval_selector = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=600,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement=UnitOfTime.SECONDS,
+            )
+        )
+        # Registers of registers.json no entity reads yet, listed by category
+        used = {param.short for param in REQUIRED_PARAMETERS}
+        register_options = [
+            selector.SelectOptionDict(value=param.short, label=f"{param.description} ({param.short})")
+            for params in category_map.values()
+            for param in params
+            if param.short not in used
+        ]
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ADAPTIVE_INTERVAL,
+                        default=self.options.get(CONF_ADAPTIVE_INTERVAL, False),
+                    ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=self.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): interval_selector,
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=self.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): interval_selector,
+                    vol.Optional(
+                        CONF_EXTRA_REGISTERS,
+                        default=self.options.get(CONF_EXTRA_REGISTERS, []),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=register_options,
+                            multiple=True,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                },
+            ),
+            errors=_errors,
+        )
@@ -1,13 +1,52 @@
 """Constants for Systemair."""
 
+from datetime import timedelta
 from enum import Enum
 from logging import Logger, getLogger
 
+from .modbus import PollClass
+
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "systemair_dev"
 ATTRIBUTION = "Data provided by Systemair SAVE Connect."
 
+# Interval of the coordinator tick, registers are only read when their poll class is due
+UPDATE_INTERVAL = timedelta(seconds=10)
+POLL_INTERVALS = {
+    PollClass.Status: timedelta(seconds=10),
+    PollClass.Alarm: timedelta(seconds=30),
+    PollClass.Function: timedelta(minutes=1),
+    PollClass.Config: timedelta(minutes=5),
+    # Settings are cached, writes and changes at the HMI panel read them again before this
+    PollClass.Setting: timedelta(hours=1),
+}
+
+# Short names of registers.json registers exposed as diagnostic sensors on top of the built-in entities
+CONF_EXTRA_REGISTERS = "extra_registers"
+
+# Options of the adaptive update interval, which keeps the gateway busy for INTERVAL_TARGET_LOAD of the time
+CONF_ADAPTIVE_INTERVAL = "adaptive_interval"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+DEFAULT_MIN_INTERVAL = 5
+DEFAULT_MAX_INTERVAL = 60
+INTERVAL_TARGET_LOAD = 0.1
+# Weight of the latest poll in the smoothed gateway busy time
+INTERVAL_BUSY_SMOOTHING = 0.3
+
+# Writes queued within this many seconds of the first one are sent as one mwrite
+WRITE_COALESCE_DELAY = 0.3
+
+# Polling of a register until it reflects a requested change, in seconds
+CONVERGENCE_INITIAL_DELAY = 0.1
+CONVERGENCE_MAX_DELAY = 1.0
+CONVERGENCE_TIMEOUT = 5.0
+
+# Seconds between a register update and saving the snapshot restored on the next startup, the
+# snapshot is saved at most once per interval
+SNAPSHOT_SAVE_INTERVAL = 60
+
 MAX_TEMP = 30
 MIN_TEMP = 12
 
@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
     SystemairApiClientError,
 )
-from .const import DOMAIN, LOGGER, SystemairModel
-from .modbus import IntegerType, parameter_map
+from .const import (
+    CONVERGENCE_INITIAL_DELAY,
+    CONVERGENCE_MAX_DELAY,
+    CONVERGENCE_TIMEOUT,
+    DOMAIN,
+    INTERVAL_BUSY_SMOOTHING,
+    INTERVAL_TARGET_LOAD,
+    LOGGER,
+    POLL_INTERVALS,
+    UPDATE_INTERVAL,
+    WRITE_COALESCE_DELAY,
+    SystemairModel,
+)
+from .modbus import (
+    ModbusParameterRegistry,
+    PollClass,
+    get_poll_class,
+    hmi_change_indicators,
+    parameter_map,
+    write_dependencies,
+)
+from .models import ModelRegisterMap, get_register_map
+from .resilience import CircuitState
+from .snapshot import RegisterSnapshot, decode_snapshot, decode_value, diff_snapshots
+from .storage import SnapshotStore, get_device_metadata_store, get_register_profile_store, get_snapshot_store
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
     from .data import SystemairConfigEntry
     from .modbus import ModbusParameter
@@ -30,27 +57,62 @@ class InvalidBooleanValueError(HomeAssistantError):
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
+class SystemairDataUpdateCoordinator(DataUpdateCoordinator[RegisterSnapshot]):
     """Class to manage fetching data from the API."""
 
     config_entry: SystemairConfigEntry
-    modbus_parameters: list[ModbusParameter]
+    modbus_parameters: ModbusParameterRegistry
+    changed_registers: frozenset[str]
+    stale: bool
     _model: SystemairModel | None = None
+    _register_map: ModelRegisterMap | None = None
+    _supported_addresses: frozenset[int] | None = None
     _missing_registers: set[str]
+    _interval_range: tuple[timedelta, timedelta] | None
+    _base_interval: timedelta
+    _busy_time: float | None
+    _poll_classes: dict[str, PollClass]
+    _class_intervals: dict[PollClass, float]
+    _next_poll: dict[str, float]
+    _pending_writes: dict[str, tuple[ModbusParameter, int]]
+    _pending_writes_done: asyncio.Future[None] | None
+    _unsub_write_flush: CALLBACK_TYPE | None
+    _snapshot_store: SnapshotStore | None = None
 
     def __init__(
         self,
         hass: HomeAssistant,
+        *,
+        interval_range: tuple[timedelta, timedelta] | None = None,
     ) -> None:
-        """Initialize."""
+        """
+        Initialize.
+
+        With an interval_range the update interval follows the measured time the gateway needs
+        to answer a poll, kept between the given floor and ceiling.
+        """
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            update_interval=UPDATE_INTERVAL,
         )
-        self.modbus_parameters = []
+        self.modbus_parameters = ModbusParameterRegistry()
+        self.changed_registers = frozenset()
+        self.stale = False
         self._missing_registers = set()
+        self._interval_range = interval_range
+        self._base_interval = UPDATE_INTERVAL
+        self._busy_time = None
+        self._poll_classes = {}
+        self._class_intervals = {
+            poll_class: interval.total_seconds() for poll_class, interval in POLL_INTERVALS.items()
+        }
+        self._next_poll = {}
+        self._pending_writes = {}
+        self._pending_writes_done = None
+        self._unsub_write_flush = None
+        self.register_modbus_parameters(*(parameter_map[short] for short in sorted(hmi_change_indicators)))
 
     @property
     def model(self) -> SystemairModel:
@@ -61,26 +123,47 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
             LOGGER.info("Detected Systemair model: %s (from: %s)", self._model.value, model_string)
         return self._model
 
-    def register_modbus_parameters(self, modbus_parameter: ModbusParameter) -> None:
-        """Register a list of Modbus parameters to be updated."""
-        if modbus_parameter not in self.modbus_parameters:
-            self.modbus_parameters.append(modbus_parameter)
-
-        if modbus_parameter.combine_with_32_bit:
-            combine_with = next(
-                (param for param in parameter_map.values() if param.register == modbus_parameter.combine_with_32_bit),
-                None,
-            )
+    def supports_parameters(self, *modbus_parameters: ModbusParameter) -> bool:
+        """Return whether the unit has all the given parameters."""
+        return all(self._resolve_supported(param) is not None for param in modbus_parameters)
+
+    def _resolve_supported(self, modbus_parameter: ModbusParameter) -> ModbusParameter | None:
+        """Return the model's version of a parameter, None if the model or the probed unit does not have it."""
+        if self._register_map is None:
+            return modbus_parameter
+        resolved = self._register_map.resolve(modbus_parameter)
+        if resolved is None or (
+            self._supported_addresses is not None and resolved.register - 1 not in self._supported_addresses
+        ):
+            return None
+        return resolved
+
+    def register_modbus_parameters(self, *modbus_parameters: ModbusParameter) -> None:
+        """
+        Register Modbus parameters to be updated.
 
-            if combine_with and combine_with not in self.modbus_parameters:
-                self.modbus_parameters.append(combine_with)
+        Once the model is known parameters are replaced by the model's version, parameters the model
+        or the probed unit does not have are never read.
+        """
+        for requested in modbus_parameters:
+            if (modbus_parameter := self._resolve_supported(requested)) is None:
+                continue
+            if modbus_parameter in self.modbus_parameters:
+                continue
+
+            self.modbus_parameters.add(modbus_parameter)
+            added = [modbus_parameter]
+            if modbus_parameter.combine_with_32_bit:
+                added.append(self.modbus_parameters.get_by_register(modbus_parameter.combine_with_32_bit))
+            for param in added:
+                if param is not None and param.short not in self._poll_classes:
+                    self._poll_classes[param.short] = get_poll_class(param)
 
     def is_register_available(self, register: ModbusParameter) -> bool:
         """Check if a register is available in the current data."""
         if self.data is None:
             return False
-        register_key = str(register.register - 1)
-        return register_key in self.data
+        return register in self.data
 
     def get_modbus_data(
         self,
@@ -99,9 +182,8 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
 
         Returns:
             The register value, or default/None if register is not available
+
         """
-        self.register_modbus_parameters(register)
-        
         if self.data is None:
             if log_missing and register.short not in self._missing_registers:
                 LOGGER.warning(
@@ -112,8 +194,7 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
                 self._missing_registers.add(register.short)
             return default
 
-        register_key = str(register.register - 1)
-        value = self.data.get(register_key)
+        value = self.data.get(register)
 
         if value is None:
             if log_missing and register.short not in self._missing_registers:
@@ -126,37 +207,52 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
                 self._missing_registers.add(register.short)
             return default
 
-        if register.boolean:
-            return value != 0
-        
-        value = int(value)
-
-        if register.combine_with_32_bit:
-            high_key = str(register.combine_with_32_bit - 1)
-            high = self.data.get(high_key)
-            if high is None:
-                if log_missing and register.short not in self._missing_registers:
-                    LOGGER.debug(
-                        "Register %s (%s) high word not available for model %s",
-                        register.short,
-                        register.combine_with_32_bit,
-                        self.model.value,
-                    )
-                    self._missing_registers.add(register.short)
-                return default
-            value += int(high) << 16
-
-        if register.sig == IntegerType.INT and value > (1 << 15):
-            value = -(65536 - value)
-        return value / (register.scale_factor or 1)
+        return value
+
+    def _due_parameters(self, now: float) -> list[ModbusParameter]:
+        """Return the registered parameters whose poll interval has elapsed, or elapses within half a tick."""
+        # Ticks are evenly spaced but the polls start with some jitter. Without the tolerance a class
+        # polled every tick, the status class, is skipped whenever a poll starts early.
+        horizon = now + self._base_interval.total_seconds() / 2
+        due = [param for param in self.modbus_parameters if self._next_poll.get(param.short, 0) <= horizon]
+        due_shorts = {param.short for param in due}
+        # Both halves of a 32-bit value have to come from the same read
+        for param in list(due):
+            if param.combine_with_32_bit:
+                partner = self.modbus_parameters.get_by_register(param.combine_with_32_bit)
+                if partner and partner.short not in due_shorts:
+                    due.append(partner)
+                    due_shorts.add(partner.short)
+        return due
+
+    def _schedule_next_poll(self, parameters: list[ModbusParameter], now: float) -> None:
+        """Schedule the next read of parameters that were just read."""
+        for param in parameters:
+            if (poll_class := self._poll_classes.get(param.short)) is not None:
+                self._next_poll[param.short] = now + self._class_intervals[poll_class]
 
     async def set_modbus_data(self, register: ModbusParameter, value: Any) -> None:
-        """Set the data for a Modbus register."""
+        """
+        Set the data for a Modbus register.
+
+        Writes are queued for a short while: the last value written to a register wins and all
+        pending registers are sent with one mwrite, followed by one read of the written registers
+        and the registers that depend on them.
+        """
+        register = self._resolve(register)
+        self._pending_writes[register.short] = (register, self._encode_value(register, value))
+        if self._pending_writes_done is None:
+            self._pending_writes_done = self.hass.loop.create_future()
+            self._unsub_write_flush = async_call_later(self.hass, WRITE_COALESCE_DELAY, self._async_flush_writes)
+        await asyncio.shield(self._pending_writes_done)
+
+    @staticmethod
+    def _encode_value(register: ModbusParameter, value: Any) -> int:
+        """Convert a value to the raw register value."""
         if register.boolean:
             if not isinstance(value, bool):
                 raise InvalidBooleanValueError
-            value = 1 if value else 0
-            return await self.config_entry.runtime_data.client.async_set_data(register, value)
+            return 1 if value else 0
 
         value = int(value)
         value = value * (register.scale_factor or 1)
@@ -164,13 +260,232 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
             value = register.min_value
         if register.max_value is not None and value > register.max_value:
             value = register.max_value
+        return value
 
-        return await self.config_entry.runtime_data.client.async_set_data(register, value)
+    async def _async_flush_writes(self, _now: datetime | None = None) -> None:
+        """Send the queued writes and read the affected registers back."""
+        pending, done = self._pending_writes, self._pending_writes_done
+        self._pending_writes, self._pending_writes_done, self._unsub_write_flush = {}, None, None
+        if done is None:
+            return
+
+        written = [register for register, _ in pending.values()]
+        try:
+            await self.config_entry.runtime_data.client.async_set_registers(dict(pending.values()))
+        except SystemairApiClientError as exception:
+            # Resynchronise the registers on the next poll
+            for register in written:
+                self._next_poll.pop(register.short, None)
+            done.set_exception(exception)
+            return
+        done.set_result(None)
+
+        affected = {register.short: register for register in written}
+        for register in written:
+            for short in write_dependencies.get(register.short, ()):
+                if (dependency := self.modbus_parameters.get(short)) is not None:
+                    affected[short] = dependency
+        try:
+            await self.async_refresh_registers(list(affected.values()))
+        except SystemairApiClientError as exception:
+            LOGGER.debug("Reading back written registers failed: %s", exception)
+            for short in affected:
+                self._next_poll.pop(short, None)
+
+    async def async_refresh_registers(self, registers: list[ModbusParameter]) -> None:
+        """Read only the given registers and publish them merged into the current snapshot."""
+        now = self.hass.loop.time()
+        registers = [self._resolve(register) for register in registers]
+        data = await self.config_entry.runtime_data.client.async_get_data(registers)
+        self._schedule_next_poll(registers, now)
+        self.async_set_updated_data(self._merge_snapshot(data))
+
+    async def async_wait_for_register(
+        self,
+        register: ModbusParameter,
+        expected: float,
+        *,
+        extra: tuple[ModbusParameter, ...] = (),
+        max_wait: float = CONVERGENCE_TIMEOUT,
+    ) -> bool:
+        """
+        Poll a register with increasing delays until it reads the expected value or max_wait passes.
+
+        Only the register and the extra registers are read, the last values read are published
+        merged into the current snapshot. Returns whether the expected value was reached, a failed
+        read returns False and leaves the registers to the next poll.
+        """
+        register = self._resolve(register)
+        registers = [register, *(self._resolve(param) for param in extra)]
+        client = self.config_entry.runtime_data.client
+        deadline = self.hass.loop.time() + max_wait
+        delay = CONVERGENCE_INITIAL_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            now = self.hass.loop.time()
+            try:
+                data = await client.async_get_data(registers)
+            except SystemairApiClientError as exception:
+                LOGGER.debug("Waiting for %s failed: %s", register.short, exception)
+                for param in registers:
+                    self._next_poll.pop(param.short, None)
+                return False
+            converged = decode_value(register, data) == expected
+            if converged or now + delay >= deadline:
+                break
+            delay = min(delay * 2, CONVERGENCE_MAX_DELAY)
+
+        self._schedule_next_poll(registers, now)
+        self.async_set_updated_data(self._merge_snapshot(data))
+        return converged
+
+    def _merge_snapshot(self, data: dict[str, Any]) -> RegisterSnapshot:
+        """Merge raw mread data into the current snapshot and record which registers changed."""
+        raw = {**self.data.raw, **data} if self.data is not None else data
+        snapshot = decode_snapshot(self.modbus_parameters, raw)
+        self.changed_registers = diff_snapshots(self.data, snapshot)
+        self.snapshot_store.async_schedule_save(raw)
+        return snapshot
+
+    @property
+    def snapshot_store(self) -> SnapshotStore:
+        """Get the store of the snapshot restored on the next startup."""
+        if self._snapshot_store is None:
+            self._snapshot_store = get_snapshot_store(self.hass, self.config_entry.entry_id)
+        return self._snapshot_store
+
+    async def async_config_entry_restore(self) -> bool:
+        """
+        Set up the coordinator from the snapshot saved by the previous run instead of a live read.
+
+        The restored snapshot is marked stale until the first live refresh, which runs in the
+        background. Returns False when no snapshot was saved, a regular first refresh is needed then.
+        """
+        raw = await self.snapshot_store.async_load()
+        if not raw:
+            return False
+
+        try:
+            await self._async_setup()
+        except SystemairApiClientError as exception:
+            raise ConfigEntryNotReady(exception) from exception
+
+        self.stale = True
+        self.data = decode_snapshot(self.modbus_parameters, raw)
+        self.config_entry.async_create_background_task(self.hass, self.async_refresh(), f"{DOMAIN} first refresh")
+        return True
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued writes, save the pending snapshot and shut down the coordinator."""
+        if self._unsub_write_flush is not None:
+            self._unsub_write_flush()
+            self._unsub_write_flush = None
+        if self._pending_writes_done is not None:
+            self._pending_writes_done.cancel()
+            self._pending_writes_done = None
+        self._pending_writes = {}
+        if self._snapshot_store is not None:
+            await self._snapshot_store.async_flush()
+        await super().async_shutdown()
 
     async def _async_setup(self) -> None:
-        """Set up the coordinator."""
-        menu = await self.config_entry.runtime_data.client.async_get_endpoint("menu")
-        unit_version = await self.config_entry.runtime_data.client.async_get_endpoint("unit_version")
+        """Set up the coordinator from the cached device metadata, fetching it only for unknown gateways."""
+        store = get_device_metadata_store(self.hass)
+        cached = await store.async_get(self.config_entry.unique_id) if self.config_entry.unique_id else None
+        if cached is None:
+            menu, unit_version = await self._async_fetch_device_metadata()
+            await store.async_set(menu, unit_version)
+        else:
+            menu, unit_version = cached
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_device_metadata(),
+                f"{DOMAIN} device metadata refresh",
+            )
+        self._apply_device_metadata(menu, unit_version)
+
+        # Initialize model detection
+        _ = self.model  # This will log the detected model
+        await self._async_load_register_profile()
+        self._apply_register_map()
+
+    async def _async_load_register_profile(self) -> None:
+        """Load the registers the unit answers, probing them on the first setup and after a firmware change."""
+        runtime_data = self.config_entry.runtime_data
+        serial_number, mb_sw_version = runtime_data.serial_number, runtime_data.mb_sw_version
+        if not serial_number or not mb_sw_version:
+            return
+
+        store = get_register_profile_store(self.hass)
+        parameters = get_register_map(self.model).parameters.values()
+        if (supported := await store.async_get(serial_number, mb_sw_version)) is None:
+            try:
+                supported = await runtime_data.client.async_probe_registers(parameters)
+            except SystemairApiClientError as exception:
+                LOGGER.warning("Discovering the supported registers failed, reading all registers: %s", exception)
+                return
+            if not supported:
+                LOGGER.warning("No register answered during discovery, reading all registers")
+                return
+            LOGGER.info("Unit %s answers %d of %d registers", serial_number, len(supported), len(parameters))
+            await store.async_set(serial_number, mb_sw_version, supported)
+        self._supported_addresses = supported
+        runtime_data.client.set_unavailable_addresses(
+            frozenset(parameter.register - 1 for parameter in parameters) - supported,
+        )
+
+    def _apply_register_map(self) -> None:
+        """Register the parameters registered so far again, resolved through the register map of the model."""
+        self._register_map = get_register_map(self.model)
+        registered = list(self.modbus_parameters)
+        self.modbus_parameters = ModbusParameterRegistry(self._register_map.by_register)
+        self._poll_classes = {}
+        self.register_modbus_parameters(*registered)
+        if dropped := len(registered) - len(self.modbus_parameters):
+            LOGGER.debug("Model %s does not have %d registered parameters", self.model.value, dropped)
+
+    def _resolve(self, register: ModbusParameter) -> ModbusParameter:
+        """Return the registered version of a parameter, which uses the address of the detected model."""
+        return self.modbus_parameters.get(register.short) or register
+
+    async def _async_fetch_device_metadata(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Fetch the menu and unit_version responses concurrently."""
+        client = self.config_entry.runtime_data.client
+        menu, unit_version = await asyncio.gather(
+            client.async_get_endpoint("menu"),
+            client.async_get_endpoint("unit_version"),
+        )
+        return menu, unit_version
+
+    async def _async_refresh_device_metadata(self) -> None:
+        """Compare the cached device metadata with the gateway and reload the entry when it changed."""
+        try:
+            menu, unit_version = await self._async_fetch_device_metadata()
+        except SystemairApiClientError as exception:
+            LOGGER.debug("Refreshing the device metadata failed: %s", exception)
+            return
+        store = get_device_metadata_store(self.hass)
+        serial_number = unit_version["System Serial Number"]
+        if serial_number != self.config_entry.runtime_data.serial_number:
+            # Another unit is connected to the gateway, nothing cached for the old one may be used again
+            LOGGER.info(
+                "Unit behind %s changed from %s to %s, dropping its cached data",
+                menu["mac"],
+                self.config_entry.runtime_data.serial_number,
+                serial_number,
+            )
+            await store.async_invalidate(menu["mac"])
+            await self.snapshot_store.async_remove()
+        if await store.async_set(menu, unit_version):
+            LOGGER.info(
+                "Device metadata of %s changed (MB SW version %s), reloading",
+                menu["mac"],
+                unit_version["MB SW version"],
+            )
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    def _apply_device_metadata(self, menu: dict[str, Any], unit_version: dict[str, Any]) -> None:
+        """Store the device metadata on the runtime data."""
         self.config_entry.runtime_data.mac_address = menu["mac"]
         self.config_entry.runtime_data.serial_number = unit_version["System Serial Number"]
         self.config_entry.runtime_data.mb_hw_version = unit_version["MB HW version"]
@@ -178,17 +493,62 @@ class SystemairDataUpdateCoordinator(DataUpdateCoordinator):
         self.config_entry.runtime_data.mb_sw_version = unit_version["MB SW version"]
         self.config_entry.runtime_data.iam_sw_version = unit_version["IAM SW version"]
 
-        # Initialize model detection
-        _ = self.model  # This will log the detected model
+    def _invalidate_settings(self) -> None:
+        """Read the cached setting registers again on the next poll."""
+        LOGGER.debug("Settings changed outside of Home Assistant, reading them again")
+        for short, poll_class in self._poll_classes.items():
+            if poll_class is PollClass.Setting:
+                self._next_poll.pop(short, None)
 
-        # Required for setup of climate entity
-        self.register_modbus_parameters(parameter_map["REG_FUNCTION_ACTIVE_HEATER"])
-        self.register_modbus_parameters(parameter_map["REG_FUNCTION_ACTIVE_COOLER"])
-        self.data = await self._async_update_data()
+    def _adapt_update_interval(self, busy_time: float | None) -> None:
+        """
+        Pick the update interval for the next poll.
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+        With an interval range the interval keeps the gateway busy for INTERVAL_TARGET_LOAD of the
+        time, status registers are then read on every poll. While the circuit towards the gateway
+        is open the next poll waits for the next probe.
+        """
+        if self._interval_range is not None and busy_time is not None:
+            if self._busy_time is None:
+                self._busy_time = busy_time
+            else:
+                self._busy_time += INTERVAL_BUSY_SMOOTHING * (busy_time - self._busy_time)
+            floor, ceiling = self._interval_range
+            self._base_interval = min(ceiling, max(floor, timedelta(seconds=self._busy_time / INTERVAL_TARGET_LOAD)))
+            self._class_intervals[PollClass.Status] = self._base_interval.total_seconds()
+
+        breaker = self.config_entry.runtime_data.client.circuit_breaker
+        if breaker.state is CircuitState.Closed:
+            self.update_interval = self._base_interval
+        else:
+            self.update_interval = max(self._base_interval, timedelta(seconds=breaker.retry_in))
+
+    async def _async_update_data(self) -> RegisterSnapshot:
+        """Read the registers that are due and decode them into a new snapshot."""
+        now = self.hass.loop.time()
+        due = self._due_parameters(now)
+        if not due:
+            self.changed_registers = frozenset()
+            return self.data
+
+        busy_time = None
         try:
-            return await self.config_entry.runtime_data.client.async_get_data(self.modbus_parameters)
+            data = await self.config_entry.runtime_data.client.async_get_data(due)
+            busy_time = self.hass.loop.time() - now
         except SystemairApiClientError as exception:
+            self.changed_registers = frozenset()
             raise UpdateFailed(exception) from exception
+        finally:
+            self._adapt_update_interval(busy_time)
+
+        # Registers missing from a partially failed read are retried on the next poll
+        self._schedule_next_poll([param for param in due if str(param.register - 1) in data], now)
+        had_data = self.data is not None
+        snapshot = self._merge_snapshot(data)
+        if had_data and not self.changed_registers.isdisjoint(hmi_change_indicators):
+            self._invalidate_settings()
+        if self.stale:
+            # Every entity writes its state once more to drop the stale flag
+            self.stale = False
+            self.changed_registers = frozenset(snapshot.decoded)
+        return snapshot
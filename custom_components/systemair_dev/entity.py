@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
 from .coordinator import SystemairDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from .modbus import ModbusParameter
+
+
+@dataclass(kw_only=True, frozen=True)
+class SystemairEntityDescription:
+    """Register a Systemair entity reads, mixed into the entity descriptions of the platforms."""
+
+    # The entity is only created when the unit has the registry
+    registry: ModbusParameter
+
+    @property
+    def registries(self) -> tuple[ModbusParameter, ...]:
+        """Return all registers the entity state is derived from."""
+        return (self.registry,)
+
 
 class SystemairEntity(CoordinatorEntity[SystemairDataUpdateCoordinator]):
     """SystemairEntity class."""
 
     _attr_attribution = ATTRIBUTION
 
+    # Short names of the registers the entity state is derived from, an empty set writes state on every update
+    _registers: frozenset[str] = frozenset()
+    _last_available: bool | None = None
+
     def __init__(self, coordinator: SystemairDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
@@ -32,3 +56,21 @@ class SystemairEntity(CoordinatorEntity[SystemairDataUpdateCoordinator]):
                 ),
             },
         )
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from the snapshot restored at startup."""
+        return self.coordinator.stale
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or one of the entity registers changed."""
+        available = self.available
+        if (
+            self._registers
+            and available == self._last_available
+            and self._registers.isdisjoint(self.coordinator.changed_registers)
+        ):
+            return
+        self._last_available = available
+        self.async_write_ha_state()
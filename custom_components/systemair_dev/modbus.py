@@ -1,7 +1,20 @@
 """Modbus parameters for Systemair ventilation units."""
 
+from __future__ import annotations
+
+import json
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+REGISTERS_FILE = Path(__file__).with_name("registers.json")
+DESCRIPTIONS_FILE = Path(__file__).with_name("register_descriptions.json")
+# Layout version of registers.json, bumped whenever its columns change
+REGISTERS_FILE_VERSION = 2
 
 
 class IntegerType(Enum):
@@ -20,6 +33,28 @@ class IntegerType(Enum):
     INT = "INT"
 
 
+class PollClass(Enum):
+    """
+
+    Enum class representing how often a Modbus register needs to be refreshed.
+
+    Attributes
+    ----------
+        Status (str): Temperatures, fan outputs and the active user mode.
+        Alarm (str): Alarm states.
+        Function (str): Active functions and installed equipment.
+        Config (str): Slowly changing values such as the filter time.
+        Setting (str): Holding registers that only change when written, by the integration or at the HMI panel.
+
+    """
+
+    Status = "Status"
+    Alarm = "Alarm"
+    Function = "Function"
+    Config = "Config"
+    Setting = "Setting"
+
+
 class RegisterType(Enum):
     """
 
@@ -36,7 +71,7 @@ class RegisterType(Enum):
     Holding = "Holding"
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ModbusParameter:
     """Describes a modbus register for Systemair."""
 
@@ -50,829 +85,70 @@ class ModbusParameter:
     boolean: bool | None = None
     scale_factor: int | None = None
     combine_with_32_bit: int | None = None
+    # Section of the Systemair register catalog the register belongs to
+    category: str | None = None
+    # Models that have the register, empty when every model has it
+    models: tuple[str, ...] = ()
 
+    def available_on(self, model: str) -> bool:
+        """Return whether the register exists on the given model."""
+        return not self.models or model in self.models
+
+
+def _load_parameters() -> list[ModbusParameter]:
+    """Load the register table, one row per register with the values in the order of its columns."""
+    table = json.loads(REGISTERS_FILE.read_text(encoding="utf-8"))
+    descriptions = json.loads(DESCRIPTIONS_FILE.read_text(encoding="utf-8"))
+    if table["version"] != REGISTERS_FILE_VERSION:
+        msg = f"{REGISTERS_FILE.name} has version {table['version']}, expected {REGISTERS_FILE_VERSION}"
+        raise ValueError(msg)
+    columns = table["columns"]
+    parameters = []
+    for row in table["registers"]:
+        values = dict(zip(columns, row, strict=True))
+        values["sig"] = IntegerType(values["sig"])
+        values["reg_type"] = RegisterType(values["reg_type"])
+        values["models"] = tuple(values["models"] or ())
+        values["description"] = descriptions.get(values["short"], values["short"])
+        parameters.append(ModbusParameter(**values))
+    return parameters
 
-parameters_list = [
-    # Demand control
-    ModbusParameter(
-        register=1001,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_DEMC_RH_HIGHEST",
-        description="Highest value of all RH sensors",
-        min_value=0,
-        max_value=100,
-    ),
-    # User modes
-    ModbusParameter(
-        register=1101,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_HOLIDAY_TIME",
-        description="Time delay setting for user mode Holiday (days)",
-        min_value=1,
-        max_value=365,
-    ),
-    ModbusParameter(
-        register=1102,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_AWAY_TIME",
-        description="Time delay setting for user mode Away (hours)",
-        min_value=1,
-        max_value=72,
-    ),
-    ModbusParameter(
-        register=1103,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_FIREPLACE_TIME",
-        description="Time delay setting for user mode Fire Place (minutes)",
-        min_value=1,
-        max_value=60,
-    ),
-    ModbusParameter(
-        register=1104,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_REFRESH_TIME",
-        description="Time delay setting for user mode Refresh (minutes)",
-        min_value=1,
-        max_value=240,
-    ),
-    ModbusParameter(
-        register=1105,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_CROWDED_TIME",
-        description="Time delay setting for user mode Crowded (hours)",
-        min_value=1,
-        max_value=8,
-    ),
-    ModbusParameter(
-        register=1111,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_USERMODE_REMAINING_TIME_L",
-        description="Remaining time for the state Holiday/Away/Fire Place/Refresh/Crowded, lower 16 bits",
-    ),
-    ModbusParameter(
-        register=1112,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_USERMODE_REMAINING_TIME_H",
-        description="Remaining time for the state Holiday/Away/Fire Place/Refresh/Crowded, higher 16 bits",
-    ),
-    ModbusParameter(
-        register=1135,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_CROWDED_AIRFLOW_LEVEL_SAF",
-        description="Fan speed level for mode Crowded.\n3: Normal\n4: High\n5: Maximum",
-        min_value=3,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1136,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_CROWDED_AIRFLOW_LEVEL_EAF",
-        description="Fan speed level for mode Crowded.\n3: Normal\n4: High\n5: Maximum",
-        min_value=3,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1137,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_REFRESH_AIRFLOW_LEVEL_SAF",
-        description="Fan speed level for mode Refresh.\n3: Normal\n4: High\n5: Maximum",
-        min_value=3,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1138,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_REFRESH_AIRFLOW_LEVEL_EAF",
-        description="Fan speed level for mode Refresh.\n3: Normal\n4: High\n5: Maximum",
-        min_value=3,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1139,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_SAF",
-        description="Fan speed level for mode Fireplace.\n3: Normal\n4: High\n5: Maximum",
-        min_value=3,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1140,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_EAF",
-        description="Fan speed level for mode Fireplace.\n1: Minimum\n2: Low\n3: Normal",
-        min_value=1,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=1141,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_AWAY_AIRFLOW_LEVEL_SAF",
-        description=(
-            "Fan speed level for mode Away.\n0: Off(1)\n1: Minimum\n2: Low\n3: Normal.\n"
-            "(1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=1142,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_AWAY_AIRFLOW_LEVEL_EAF",
-        description=(
-            "Fan speed level for mode Away.\n0: Off(1)\n1: Minimum\n2: Low\n3: Normal.\n"
-            "(1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=1143,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_SAF",
-        description=(
-            "Fan speed level for mode Holiday.\n0: Off(1)\n1: Minimum\n2: Low\n3: Normal.\n(1): value"
-            "Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=1144,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_EAF",
-        description=(
-            "Fan speed level for mode Holiday.\n0: Off(1)\n1: Minimum\n2: Low\n3: Normal.\n(1): value"
-            "Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=1145,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_SAF",
-        description="Fan speed level for mode Cooker Hood.\n2: Low\n3: Normal\n4: High",
-        min_value=1,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1146,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_EAF",
-        description="Fan speed level for mode Cooker Hood.\n2: Low\n3: Normal\n4: High",
-        min_value=1,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1147,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_SAF",
-        description="Fan speed level for mode Vacuum Cleaner.\n2: Low\n3: Normal\n4: High",
-        min_value=1,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1148,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_EAF",
-        description="Fan speed level for mode Vacuum Cleaner.\n2: Low\n3: Normal\n4: High",
-        min_value=1,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1161,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_USERMODE_MODE",
-        description=(
-            "Active User mode.\n0: Auto\n1: Manual\n2: Crowded\n3: Refresh\n4: Fireplace\n5: Away\n6: Holiday\n"
-            "7: Cooker Hood\n8: Vacuum Cleaner\n9: CDI1\n10: CDI2\n11: CDI3\n12: PressureGuard"
-        ),
-        min_value=0,
-        max_value=12,
-    ),
-    ModbusParameter(
-        register=1162,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_HMI_CHANGE_REQUEST",
-        description=(
-            "New desired user mode as requested by HMI\n0: None\n1: Auto\n2: Manual\n3: Crowded\n4: Refresh\n"
-            "5: Fireplace\n6: Away\n7: Holiday"
-        ),
-        min_value=0,
-        max_value=7,
-    ),
-    ModbusParameter(
-        register=1177,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_PRESSURE_GUARD_AIRFLOW_LEVEL_SAF",
-        description=(
-            "Fan speed level for configurable pressure guard function.\n0: Off\n1: Minimum\n2: Low\n3: Normal\n"
-            "4: High\n5: Maximum"
-        ),
-        min_value=0,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=1178,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_PRESSURE_GUARD_AIRFLOW_LEVEL_EAF",
-        description=(
-            "Fan speed level for configurable pressure guard function.\n0: Off\n1: Minimum\n2: Low\n"
-            "3: Normal\n4: High\n5: Maximum"
-        ),
-        min_value=0,
-        max_value=5,
-    ),
-    ModbusParameter(
-        register=12306,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_SENSOR_DI_COOKERHOOD",
-        description="Cooker hood",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=12307,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_SENSOR_DI_VACUUMCLEANER",
-        description="Vacuum cleaner",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=3114,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_PRESSURE_GUARD",
-        description="Pressure guard",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=3115,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_CDI_1",
-        description="Configurable DI1",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=3116,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_CDI_2",
-        description="Configurable DI2",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=3117,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_CDI_3",
-        description="Configurable DI3",
-        boolean=True,
-    ),
-    # Airflow control
-    ModbusParameter(
-        register=12401,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_SENSOR_RPM_SAF",
-        description="Supply Air Fan RPM indication from TACHO",
-        min_value=0,
-        max_value=5000,
-    ),
-    ModbusParameter(
-        register=12402,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_SENSOR_RPM_EAF",
-        description="Extract Air Fan RPM indication from TACHO",
-        min_value=0,
-        max_value=5000,
-    ),
-    ModbusParameter(
-        register=1131,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF",
-        description=(
-            "Fan speed level for mode Manual. Applies to both the SAF and the EAF fan.\n0: Off(1)\n2: Low\n3: Normal\n"
-            "4: High\n(1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=4,
-    ),
-    ModbusParameter(
-        register=1130,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_USERMODE_MANUAL_COMMAND",
-        description=(
-            "Manual mode command register.\n0: Off(1)\n2: Low\n3: Normal\n4: High\n"
-            "(1): value Off only allowed if contents of register REG_FAN_MANUAL_STOP_ALLOWED is 1."
-        ),
-        min_value=0,
-        max_value=4,
-    ),
-    ModbusParameter(
-        register=14001,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_SAF",
-        description="SAF fan speed",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=14002,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_EAF",
-        description="EAF fan speed",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=14000,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_OUTPUT_SAF_POWER_FACTOR",
-        description="Supply Air Fan Power Factor (may be same as REG_OUTPUT_SAF)",
-        min_value=0,
-        max_value=100,
-    ),
-    # Note: EAF Power Factor may be same as REG_OUTPUT_EAF (14002)
-    # Temperature control
-    ModbusParameter(
-        register=2001,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_TC_SP",
-        description="Temperature setpoint for the supply air temperature",
-        scale_factor=10,
-        min_value=120,
-        max_value=300,
-    ),
-    # Cooler
-    ModbusParameter(
-        register=3014,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_COOLER",
-        description="Which type of cooler is active (0=None, 1=Water, 2=Change over)",
-        min_value=0,
-        max_value=2,
-    ),
-    ModbusParameter(
-        register=14201,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_Y3_ANALOG",
-        description="Cooler AO state",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=14202,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_Y3_DIGITAL",
-        description="Cooler DO state:\n0: Output not active\n1: Output active",
-        boolean=True,
-    ),
-    # Heater
-    ModbusParameter(
-        register=3002,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_HEATER",
-        description="Which type of heater is active",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=3113,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_FUNCTION_ACTIVE_HEATER_COOL_DOWN",
-        description="Active Heater Cool Down",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=14381,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_TRIAC",
-        description="TRIAC control signal",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=2149,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_PWM_TRIAC_OUTPUT",
-        description="TRIAC after manual override",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=14101,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_Y1_ANALOG",
-        description="Heater AO state",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=14102,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_Y1_DIGITAL",
-        description="Heater DO state:\n0: Output not active\n1: Output active",
-        boolean=True,
-    ),
-    # ECO mode
-    ModbusParameter(
-        register=2505,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_ECO_MODE_ON_OFF",
-        description="Enabling of eco mode",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=2503,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_ECO_HEAT_OFFSET",
-        description="Temperature offset for heating during Eco mode",
-        scale_factor=10,
-        min_value=0,
-        max_value=100,
-    ),
-    # Free Cooling
-    ModbusParameter(
-        register=4100,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_FREE_COOLING_ON_OFF",
-        description="Enabling of free cooling",
-        boolean=True,
-    ),
-    # Filter replacement
-    ModbusParameter(
-        register=7005,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FILTER_REMAINING_TIME_L",
-        description="Remaining filter time in seconds, lower 16 bits",
-        combine_with_32_bit=7006,
-    ),
-    ModbusParameter(
-        register=7006,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_FILTER_REMAINING_TIME_H",
-        description="Remaining filter time in seconds, higher 16 bits",
-        combine_with_32_bit=7005,
-    ),
-    ModbusParameter(
-        register=7000,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_FILTER_REPLACEMENT_PERIOD",
-        description="Filter replacement period in months",
-        min_value=3,
-        max_value=15,
-    ),
-    # Moisture extraction setpoint
-    ModbusParameter(
-        register=2202,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_MOISTURE_EXTRACTION_SP",
-        description="Moisture extraction setpoint",
-        min_value=0,
-        max_value=100,
-    ),
-    # Analog Input values (Temperatures, CO2, RH)
-    ModbusParameter(
-        register=12102,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_OAT",
-        description="Outdoor Air Temperature sensor (standard)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12103,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_SAT",
-        description="Supply Air Temperature sensor (standard)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12105,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_EAT",
-        description="Extract Air Temperature sensor (accessory)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12108,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_OHT",
-        description="Overheat Temperature sensor (Electrical Heater)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12109,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_RHS",
-        description="Relative Humidity Sensor (Accessory)",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=12544,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_PDM_EAT_VALUE",
-        description="PDM EAT sensor value (standard)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12136,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_RHS_PDM",
-        description="PDM RHS sensor value (standard)",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=12106,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_EFFICIENCY_TEMP",
-        description="Efficiency Temperature",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    ModbusParameter(
-        register=12107,
-        sig=IntegerType.INT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_OHT_ALT",
-        description="Overheat Temperature sensor (alternative register)",
-        scale_factor=10,
-        min_value=-400,
-        max_value=800,
-    ),
-    # Calculated moisture values
-    ModbusParameter(
-        register=2210,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_CALC_MOISTURE_EXTRACTION",
-        description="Calculated moisture extraction",
-        min_value=0,
-        max_value=100,
-    ),
-    ModbusParameter(
-        register=2211,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Holding,
-        short="REG_SENSOR_CALC_MOISTURE_INTAKE",
-        description="Calculated moisture intake",
-        min_value=0,
-        max_value=100,
-    ),
-    # Output values
-    ModbusParameter(
-        register=14104,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_OUTPUT_Y2_DIGITAL",
-        description="Heat Exchanger DO state.0: Output not active1: Output active",
-        boolean=True,
-    ),
-    # Alarms
-    ModbusParameter(
-        register=15016,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_FROST_PROT_ALARM",
-        description="Frost protection",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15023,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_DEFROSTING_ALARM",
-        description="Defrosting",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15030,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_SAF_RPM_ALARM",
-        description="Supply air fan RPM",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15037,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_EAF_RPM_ALARM",
-        description="Extract air fan RPM",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15072,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_SAT_ALARM",
-        description="Supply air temperature",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15086,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_EAT_ALARM",
-        description="Extract air temperature",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15121,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_RGS_ALARM",
-        description="Rotation guard (RGS)",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15142,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_FILTER_ALARM",
-        description="Filter",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15170,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_CO2_ALARM",
-        description="CO2",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15177,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_LOW_SAT_ALARM",
-        description="Low supply air temperature",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15530,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_OVERHEAT_TEMPERATURE_ALARM",
-        description="Overheat temperature",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15537,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_FIRE_ALARM_ALARM",
-        description="Fire alarm",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15544,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_FILTER_WARNING_ALARM",
-        description="Filter warning",
-        min_value=0,
-        max_value=3,
-    ),
-    ModbusParameter(
-        register=15901,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_TYPE_A",
-        description="Indicates if an alarm Type A is active",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=15902,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_TYPE_B",
-        description="Indicates if an alarm Type B is active",
-        boolean=True,
-    ),
-    ModbusParameter(
-        register=15903,
-        sig=IntegerType.UINT,
-        reg_type=RegisterType.Input,
-        short="REG_ALARM_TYPE_C",
-        description="Indicates if an alarm Type C is active",
-        boolean=True,
-    ),
-]
 
+def _index_by_category(parameters: list[ModbusParameter]) -> dict[str, tuple[ModbusParameter, ...]]:
+    """Index the parameters by catalog category."""
+    categories: dict[str, list[ModbusParameter]] = {}
+    for param in parameters:
+        categories.setdefault(param.category or "other", []).append(param)
+    return {category: tuple(params) for category, params in categories.items()}
+
+
+# The table is loaded once on import, Home Assistant imports the integration in the executor
+parameters_list = _load_parameters()
 parameter_map = {param.short: param for param in parameters_list}
+register_map = {param.register: param for param in parameters_list}
+category_map = _index_by_category(parameters_list)
 
-operation_parameters = {
-    short: parameter_map[short]
-    for short in [
+# Short names of the parameters in each group
+PARAMETER_GROUPS: dict[str, tuple[str, ...]] = {
+    "operation": (
         "REG_TC_SP",
         "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF",
+        "REG_USERMODE_MANUAL_COMMAND",
         "REG_USERMODE_MODE",
         "REG_ECO_MODE_ON_OFF",
         "REG_SENSOR_RPM_SAF",
         "REG_SENSOR_RPM_EAF",
         "REG_OUTPUT_SAF",
         "REG_OUTPUT_EAF",
-    ]
-}
-
-sensor_parameters = {
-    short: parameter_map[short]
-    for short in [
+    ),
+    "sensor": (
         "REG_SENSOR_RHS_PDM",
         "REG_SENSOR_OAT",
         "REG_SENSOR_SAT",
         "REG_SENSOR_PDM_EAT_VALUE",
         "REG_SENSOR_OHT",
-    ]
-}
-
-config_parameters = {
-    short: parameter_map[short]
-    for short in [
+    ),
+    "config": (
         "REG_FILTER_REMAINING_TIME_L",
         "REG_FILTER_REMAINING_TIME_H",
         "REG_FREE_COOLING_ON_OFF",
@@ -884,12 +160,8 @@ config_parameters = {
         "REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_SAF",
         "REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_SAF",
         "REG_PRESSURE_GUARD_AIRFLOW_LEVEL_SAF",
-    ]
-}
-
-alarm_parameters = {
-    short: parameter_map[short]
-    for short in [
+    ),
+    "alarm": (
         "REG_ALARM_FROST_PROT_ALARM",
         "REG_ALARM_DEFROSTING_ALARM",
         "REG_ALARM_SAF_RPM_ALARM",
@@ -906,12 +178,8 @@ alarm_parameters = {
         "REG_ALARM_TYPE_A",
         "REG_ALARM_TYPE_B",
         "REG_ALARM_TYPE_C",
-    ]
-}
-
-function_parameters = {
-    short: parameter_map[short]
-    for short in [
+    ),
+    "function": (
         "REG_FUNCTION_ACTIVE_PRESSURE_GUARD",
         "REG_SENSOR_DI_COOKERHOOD",
         "REG_SENSOR_DI_VACUUMCLEANER",
@@ -919,5 +187,152 @@ function_parameters = {
         "REG_FUNCTION_ACTIVE_CDI_1",
         "REG_FUNCTION_ACTIVE_CDI_2",
         "REG_FUNCTION_ACTIVE_CDI_3",
-    ]
+    ),
+}
+
+
+operation_parameters = {short: parameter_map[short] for short in PARAMETER_GROUPS["operation"]}
+sensor_parameters = {short: parameter_map[short] for short in PARAMETER_GROUPS["sensor"]}
+config_parameters = {short: parameter_map[short] for short in PARAMETER_GROUPS["config"]}
+alarm_parameters = {short: parameter_map[short] for short in PARAMETER_GROUPS["alarm"]}
+function_parameters = {short: parameter_map[short] for short in PARAMETER_GROUPS["function"]}
+
+# Every register read by an entity, registered before the first refresh so it returns full state.
+# The platforms register the registers of their entities again when they are set up, a register
+# left out here is then read from the next poll on.
+REQUIRED_PARAMETERS: tuple[ModbusParameter, ...] = (
+    *(
+        parameter_map[short]
+        for short in (
+            # Climate
+            "REG_FUNCTION_ACTIVE_HEATER",
+            "REG_FUNCTION_ACTIVE_COOLER",
+            "REG_OUTPUT_TRIAC",
+            "REG_OUTPUT_Y3_DIGITAL",
+            "REG_SENSOR_RHS_PDM",
+            "REG_SENSOR_SAT",
+            "REG_TC_SP",
+            "REG_USERMODE_MODE",
+            "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF",
+            # Binary sensors
+            "REG_OUTPUT_Y2_DIGITAL",
+            # Numbers
+            "REG_USERMODE_HOLIDAY_TIME",
+            "REG_USERMODE_AWAY_TIME",
+            "REG_USERMODE_FIREPLACE_TIME",
+            "REG_USERMODE_REFRESH_TIME",
+            "REG_USERMODE_CROWDED_TIME",
+            "REG_ECO_HEAT_OFFSET",
+            "REG_FILTER_REPLACEMENT_PERIOD",
+            "REG_MOISTURE_EXTRACTION_SP",
+            # Sensors
+            "REG_SENSOR_OAT",
+            "REG_SENSOR_PDM_EAT_VALUE",
+            "REG_SENSOR_OHT",
+            "REG_SENSOR_EFFICIENCY_TEMP",
+            "REG_SENSOR_OHT_ALT",
+            "REG_SENSOR_CALC_MOISTURE_EXTRACTION",
+            "REG_SENSOR_CALC_MOISTURE_INTAKE",
+            "REG_OUTPUT_SAF_POWER_FACTOR",
+            "REG_USERMODE_MANUAL_COMMAND",
+            "REG_OUTPUT_SAF",
+            "REG_OUTPUT_EAF",
+            "REG_SENSOR_RPM_SAF",
+            "REG_SENSOR_RPM_EAF",
+            "REG_PWM_TRIAC_OUTPUT",
+            "REG_FILTER_REMAINING_TIME_L",
+            "REG_USERMODE_REMAINING_TIME_L",
+            # Switches
+            "REG_ECO_MODE_ON_OFF",
+            "REG_FREE_COOLING_ON_OFF",
+        )
+    ),
+    # Alarm sensors
+    *alarm_parameters.values(),
+)
+
+
+# Registers whose value changes as a side effect of writing another register
+write_dependencies = {
+    "REG_USERMODE_HMI_CHANGE_REQUEST": (
+        "REG_USERMODE_MODE",
+        "REG_USERMODE_REMAINING_TIME_L",
+        "REG_USERMODE_REMAINING_TIME_H",
+    ),
+    "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF": (
+        "REG_USERMODE_MODE",
+        "REG_USERMODE_MANUAL_COMMAND",
+    ),
 }
+
+
+# Holding registers read with the status registers. A change the integration did not write means
+# someone is using the HMI panel, the cached settings are read again on the next poll.
+hmi_change_indicators = frozenset(
+    {
+        "REG_TC_SP",
+        "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF",
+        "REG_USERMODE_MODE",
+        "REG_ECO_MODE_ON_OFF",
+    }
+)
+
+
+def get_poll_class(parameter: ModbusParameter) -> PollClass:
+    """Return the poll class of a Modbus parameter."""
+    short = parameter.short
+    if short in operation_parameters or short in sensor_parameters:
+        return PollClass.Status
+    if short in alarm_parameters:
+        return PollClass.Alarm
+    if short in function_parameters or short.startswith("REG_FUNCTION_ACTIVE_"):
+        return PollClass.Function
+    if parameter.reg_type == RegisterType.Holding and not short.startswith(("REG_SENSOR_", "REG_OUTPUT_")):
+        return PollClass.Setting
+    if short in config_parameters:
+        return PollClass.Config
+    return PollClass.Status
+
+
+class ModbusParameterRegistry:
+    """Set of Modbus parameters indexed by short name and register address."""
+
+    def __init__(self, parameters_by_register: Mapping[int, ModbusParameter] | None = None) -> None:
+        """Initialize an empty registry, 32-bit partners are looked up in parameters_by_register."""
+        self._parameters_by_register = register_map if parameters_by_register is None else parameters_by_register
+        self._by_short: dict[str, ModbusParameter] = {}
+        self._by_register: dict[int, ModbusParameter] = {}
+
+    def __contains__(self, parameter: object) -> bool:
+        """Return whether the parameter is registered."""
+        return isinstance(parameter, ModbusParameter) and parameter.short in self._by_short
+
+    def __iter__(self) -> Iterator[ModbusParameter]:
+        """Iterate over the registered parameters in registration order."""
+        return iter(self._by_short.values())
+
+    def __len__(self) -> int:
+        """Return the number of registered parameters."""
+        return len(self._by_short)
+
+    def add(self, parameter: ModbusParameter) -> bool:
+        """Register a parameter together with the other half of a 32-bit value, return whether it was new."""
+        if parameter.short in self._by_short:
+            return False
+
+        self._by_short[parameter.short] = parameter
+        self._by_register[parameter.register] = parameter
+
+        if parameter.combine_with_32_bit and (
+            combine_with := self._parameters_by_register.get(parameter.combine_with_32_bit)
+        ):
+            self.add(combine_with)
+        return True
+
+    def get(self, short: str) -> ModbusParameter | None:
+        """Return the registered parameter with the given short name."""
+        return self._by_short.get(short)
+
+    def get_by_register(self, register: int) -> ModbusParameter | None:
+        """Return the registered parameter with the given register address."""
+        return self._by_register.get(register)
@@ -0,0 +1,58 @@
+"""Model specific register maps for Systemair."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from .const import SystemairModel
+from .modbus import ModbusParameter, parameters_list
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Changes to the base register map per model, applied after dropping the registers registers.json does
+# not list for the model. A parameter replaces the base parameter with the same short name, None marks
+# a register the model does not have. The address differences listed in PORTING_PLAN.md still have
+# to be verified on the units, until then every model uses the base map.
+MODEL_OVERRIDES: dict[SystemairModel, dict[str, ModbusParameter | None]] = {
+    SystemairModel.VTR300: {},
+    SystemairModel.VTR500: {},
+    SystemairModel.VSR300: {},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRegisterMap:
+    """Immutable register map of a single model, indexed by short name and register address."""
+
+    model: SystemairModel
+    parameters: Mapping[str, ModbusParameter]
+    by_register: Mapping[int, ModbusParameter]
+
+    def resolve(self, parameter: ModbusParameter) -> ModbusParameter | None:
+        """Return the model's version of a parameter, None if the model does not have it."""
+        return self.parameters.get(parameter.short)
+
+
+@cache
+def get_register_map(model: SystemairModel) -> ModelRegisterMap:
+    """Return the register map of a model, compiled from the base map and its overrides on first use."""
+    # An unknown model keeps every register, the probe drops the ones its unit does not answer
+    parameters = {
+        parameter.short: parameter
+        for parameter in parameters_list
+        if model is SystemairModel.UNKNOWN or parameter.available_on(model.value)
+    }
+    for short, override in MODEL_OVERRIDES.get(model, {}).items():
+        if override is None:
+            parameters.pop(short, None)
+        else:
+            parameters[short] = override
+    return ModelRegisterMap(
+        model=model,
+        parameters=MappingProxyType(parameters),
+        by_register=MappingProxyType({parameter.register: parameter for parameter in parameters.values()}),
+    )
@@ -16,16 +16,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import SystemairDataUpdateCoordinator
 from .data import SystemairConfigEntry
-from .entity import SystemairEntity
-from .modbus import ModbusParameter, parameter_map
+from .entity import SystemairEntity, SystemairEntityDescription
+from .modbus import parameter_map
 
 
 @dataclass(kw_only=True, frozen=True)
-class SystemairNumberEntityDescription(NumberEntityDescription):
+class SystemairNumberEntityDescription(NumberEntityDescription, SystemairEntityDescription):
     """Describes a Systemair number entity."""
 
-    registry: ModbusParameter
-
 
 NUMBERS: tuple[SystemairNumberEntityDescription, ...] = (
     SystemairNumberEntityDescription(
@@ -122,12 +120,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up number from a config entry."""
+    entry.runtime_data.coordinator.register_modbus_parameters(
+        *(param for entity_description in NUMBERS for param in entity_description.registries)
+    )
     async_add_entities(
         SystemairNumber(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
         for entity_description in NUMBERS
+        if entry.runtime_data.coordinator.supports_parameters(entity_description.registry)
     )
 
 
@@ -148,6 +150,7 @@ class SystemairNumber(SystemairEntity, NumberEntity):
 
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{entity_description.key}"
+        self._registers = frozenset(param.short for param in entity_description.registries)
         # Account for scale_factor in min/max values
         scale = entity_description.registry.scale_factor or 1
         min_val = entity_description.registry.min_value or 0
@@ -166,5 +169,3 @@ class SystemairNumber(SystemairEntity, NumberEntity):
             await self.coordinator.set_modbus_data(self.entity_description.registry, value)
         except (asyncio.exceptions.TimeoutError, ConnectionError) as exc:
             raise HomeAssistantError from exc
-        finally:
-            await self.coordinator.async_refresh()
@@ -0,0 +1,147 @@
+"""Read planning for the SAVE Connect mread endpoint."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .modbus import ModbusParameter
+
+# Number of unused registers allowed between two requested registers before a new range is started.
+DEFAULT_MAX_GAP = 10
+# Largest block a single Modbus read can return.
+MAX_RANGE_COUNT = 125
+# Conservative url length limit, not verified on SAVE Connect hardware. It matches the simulator limit.
+DEFAULT_MAX_URL_LENGTH = 2048
+
+
+@dataclass(frozen=True, slots=True)
+class ReadRange:
+    """A contiguous block of registers fetched with a single mread entry."""
+
+    start: int
+    count: int
+
+    @property
+    def stop(self) -> int:
+        """Return the first address after the range."""
+        return self.start + self.count
+
+
+@dataclass(frozen=True, slots=True)
+class ReadPlan:
+    """Ranges to read and the addresses that were actually requested."""
+
+    ranges: tuple[ReadRange, ...]
+    addresses: frozenset[int]
+
+    @property
+    def query(self) -> str:
+        """Return the url encoded mread query for the plan."""
+        return ",".join(_query_entry(item) for item in self.ranges)
+
+    def chunk(self, *, max_query_length: int, max_registers: int | None = None) -> tuple[ReadPlan, ...]:
+        """
+        Split the plan into plans whose query fits max_query_length and that read at most max_registers.
+
+        Ranges larger than max_registers are split themselves, everything else keeps its range.
+        """
+        ranges = [
+            ReadRange(start=start, count=min(step, item.stop - start))
+            for item in self.ranges
+            for step in (min(item.count, max_registers or item.count),)
+            for start in range(item.start, item.stop, step)
+        ]
+
+        chunks: list[list[ReadRange]] = [[]]
+        query_length = registers = 0
+        for item in ranges:
+            entry_length = len(_query_entry(item)) + 1
+            if chunks[-1] and (
+                query_length + entry_length - 1 > max_query_length
+                or (max_registers is not None and registers + item.count > max_registers)
+            ):
+                chunks.append([])
+                query_length = registers = 0
+            chunks[-1].append(item)
+            query_length += entry_length
+            registers += item.count
+
+        if len(chunks) == 1:
+            return (self,)
+        return tuple(
+            ReadPlan(
+                ranges=tuple(chunk),
+                addresses=frozenset(
+                    address for address in self.addresses if any(item.start <= address < item.stop for item in chunk)
+                ),
+            )
+            for chunk in chunks
+        )
+
+    def split(self, response: dict[str, Any]) -> dict[str, Any]:
+        """
+        Split an mread response back into one entry per requested register.
+
+        The gateway answers a range read with a list of values under the start address,
+        a single register read with a plain value.
+        """
+        data: dict[str, Any] = {}
+        for item in self.ranges:
+            value = response.get(str(item.start))
+            if isinstance(value, list):
+                for offset, register_value in enumerate(value[: item.count]):
+                    address = item.start + offset
+                    if address in self.addresses:
+                        data[str(address)] = register_value
+            elif value is not None:
+                data[str(item.start)] = value
+
+            # Some firmware versions answer with one key per address instead
+            for address in range(item.start + 1, item.stop):
+                key = str(address)
+                if address in self.addresses and key not in data and key in response:
+                    data[key] = response[key]
+        return data
+
+
+def _query_entry(item: ReadRange) -> str:
+    """Return the url encoded mread entry of a range."""
+    return f"%22{item.start}%22:{item.count}"
+
+
+def build_read_plan(
+    parameters: Iterable[ModbusParameter],
+    *,
+    max_gap: int = DEFAULT_MAX_GAP,
+    unavailable: frozenset[int] = frozenset(),
+) -> ReadPlan:
+    """
+    Merge the registers of the given parameters into as few range reads as possible.
+
+    Registers closer than max_gap to the previous one are read as part of the same range,
+    the unused registers in between are dropped again when the response is split.
+    A gap is never bridged across an address in unavailable, as the unit rejects ranges
+    that contain a register it does not implement.
+    """
+    addresses = sorted({parameter.register - 1 for parameter in parameters})
+    ranges: list[ReadRange] = []
+    start = previous = None
+    for address in addresses:
+        if (
+            start is not None
+            and address - previous - 1 <= max_gap
+            and address - start < MAX_RANGE_COUNT
+            and unavailable.isdisjoint(range(previous + 1, address))
+        ):
+            previous = address
+            continue
+        if start is not None:
+            ranges.append(ReadRange(start=start, count=previous - start + 1))
+        start = previous = address
+    if start is not None:
+        ranges.append(ReadRange(start=start, count=previous - start + 1))
+    return ReadPlan(ranges=tuple(ranges), addresses=frozenset(addresses))
@@ -0,0 +1,146 @@
+"""Retry, timeout and circuit breaker handling for gateway requests."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+# Consecutive failed requests before the circuit opens
+DEFAULT_FAILURE_THRESHOLD = 3
+# Seconds the circuit stays open after it first opens, doubled after every failed probe
+DEFAULT_OPEN_DURATION = 10.0
+DEFAULT_MAX_OPEN_DURATION = 300.0
+
+# Request timeouts in seconds, derived from the latency of the last LATENCY_WINDOW requests
+DEFAULT_TIMEOUT = 10.0
+MIN_TIMEOUT = 2.0
+MAX_TIMEOUT = 30.0
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_FACTOR = 3.0
+
+
+class CircuitState(Enum):
+    """
+
+    Enum class representing the state of the circuit breaker of a gateway.
+
+    Attributes
+    ----------
+        Closed (str): Requests are sent to the gateway.
+        Open (str): Requests fail without reaching the gateway until a probe is due.
+        HalfOpen (str): A probe read is in flight, its outcome closes or reopens the circuit.
+
+    """
+
+    Closed = "closed"
+    Open = "open"
+    HalfOpen = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How often a request is attempted and how long to back off between the attempts."""
+
+    attempts: int
+    base_delay: float
+    max_delay: float
+
+    def delay(self, attempt: int) -> float:
+        """Return the backoff before the given retry, exponential with equal jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+
+# A failed poll is repeated by the next poll anyway, a failed write is lost to the user
+READ_RETRY_POLICY = RetryPolicy(attempts=2, base_delay=0.5, max_delay=2.0)
+WRITE_RETRY_POLICY = RetryPolicy(attempts=4, base_delay=0.5, max_delay=4.0)
+
+
+class LatencyTracker:
+    """Rolling window of the request durations towards a gateway."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize an empty window."""
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, duration: float) -> None:
+        """Add the duration of a request, timed out requests are recorded with the time they waited."""
+        self._samples.append(duration)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the duration below which the given fraction of the requests completed."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout for the next request, DEFAULT_TIMEOUT until enough requests were measured."""
+        if len(self._samples) < LATENCY_MIN_SAMPLES:
+            return DEFAULT_TIMEOUT
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, self.percentile(TIMEOUT_PERCENTILE) * TIMEOUT_FACTOR))
+
+
+class CircuitBreaker:
+    """
+    Tracks failed requests towards a gateway and stops sending requests while it keeps failing.
+
+    After failure_threshold consecutive failures the circuit opens for open_duration seconds.
+    Once that passed a single probe read decides whether the circuit closes again, a failed
+    probe doubles the open duration up to max_open_duration.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        open_duration: float = DEFAULT_OPEN_DURATION,
+        max_open_duration: float = DEFAULT_MAX_OPEN_DURATION,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self._failure_threshold = failure_threshold
+        self._base_open_duration = open_duration
+        self._max_open_duration = max_open_duration
+        self.state = CircuitState.Closed
+        self.failures = 0
+        self.open_duration = 0.0
+        self._retry_at = 0.0
+
+    @property
+    def probe_due(self) -> bool:
+        """Return whether the circuit is open and the next probe may be sent."""
+        return self.state is CircuitState.Open and time.monotonic() >= self._retry_at
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe may be sent."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def half_open(self) -> None:
+        """Mark a probe as in flight."""
+        self.state = CircuitState.HalfOpen
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CircuitState.Closed
+        self.failures = 0
+        self.open_duration = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit once the threshold is reached or a probe failed."""
+        self.failures += 1
+        if self.state is CircuitState.Closed and self.failures < self._failure_threshold:
+            return
+        self.open_duration = min(
+            self._max_open_duration,
+            self.open_duration * 2 if self.open_duration else self._base_open_duration,
+        )
+        self.state = CircuitState.Open
+        # Jitter keeps several entries on the same network from probing in lockstep
+        self._retry_at = time.monotonic() + self.open_duration * random.uniform(0.8, 1.2)  # noqa: S311
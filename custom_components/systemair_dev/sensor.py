@@ -12,10 +12,13 @@ from homeassistant.components.sensor import (
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.const import PERCENTAGE, REVOLUTIONS_PER_MINUTE, EntityCategory, UnitOfTemperature, UnitOfTime
 
-from .entity import SystemairEntity
+from .const import CONF_EXTRA_REGISTERS
+from .entity import SystemairEntity, SystemairEntityDescription
 from .modbus import ModbusParameter, alarm_parameters, parameter_map
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -31,12 +34,21 @@ ALARM_STATE_TO_VALUE_MAP = {
 
 VALUE_MAP_TO_ALARM_STATE = {value: key for key, value in ALARM_STATE_TO_VALUE_MAP.items()}
 
+# Countdown sensors combine the remaining time with the active user mode
+_COUNTDOWN_REGISTRIES = (parameter_map["REG_USERMODE_MODE"],)
+
 
 @dataclass(kw_only=True, frozen=True)
-class SystemairSensorEntityDescription(SensorEntityDescription):
+class SystemairSensorEntityDescription(SensorEntityDescription, SystemairEntityDescription):
     """Describes a Systemair sensor entity."""
 
-    registry: ModbusParameter
+    # Extra registries may be missing on the unit
+    extra_registries: tuple[ModbusParameter, ...] = ()
+
+    @property
+    def registries(self) -> tuple[ModbusParameter, ...]:
+        """Return all registers the sensor state is derived from."""
+        return (self.registry, *self.extra_registries)
 
 
 ENTITY_DESCRIPTIONS = (
@@ -135,13 +147,16 @@ ENTITY_DESCRIPTIONS = (
         translation_key="enhanced_mode_status",
         entity_category=EntityCategory.DIAGNOSTIC,
         registry=parameter_map["REG_USERMODE_MODE"],  # Use mode register as base, but we'll compute the value
+        extra_registries=(parameter_map["REG_USERMODE_MANUAL_COMMAND"],),
     ),
     SystemairSensorEntityDescription(
         key="supply_air_flow_rate",
         translation_key="supply_air_flow_rate",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="m³/h",
-        registry=parameter_map["REG_OUTPUT_SAF_POWER_FACTOR"],  # Base register, but we'll compute the value
+        # Base register, the value is computed from the power factor when the unit has it
+        registry=parameter_map["REG_OUTPUT_SAF"],
+        extra_registries=(parameter_map["REG_OUTPUT_SAF_POWER_FACTOR"],),
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:air-filter",
     ),
@@ -160,6 +175,7 @@ ENTITY_DESCRIPTIONS = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         registry=parameter_map["REG_SENSOR_SAT"],  # Base register, but we'll compute the value
+        extra_registries=(parameter_map["REG_SENSOR_OAT"], parameter_map["REG_SENSOR_PDM_EAT_VALUE"]),
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:heat-wave",
     ),
@@ -227,6 +243,7 @@ ENTITY_DESCRIPTIONS = (
         key="countdown_away",
         translation_key="countdown_away",
         registry=parameter_map["REG_USERMODE_REMAINING_TIME_L"],  # Base register, but we'll compute the value
+        extra_registries=_COUNTDOWN_REGISTRIES,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:exit-run",
     ),
@@ -234,6 +251,7 @@ ENTITY_DESCRIPTIONS = (
         key="countdown_crowded",
         translation_key="countdown_crowded",
         registry=parameter_map["REG_USERMODE_REMAINING_TIME_L"],  # Base register, but we'll compute the value
+        extra_registries=_COUNTDOWN_REGISTRIES,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:account-multiple",
     ),
@@ -241,6 +259,7 @@ ENTITY_DESCRIPTIONS = (
         key="countdown_refresh",
         translation_key="countdown_refresh",
         registry=parameter_map["REG_USERMODE_REMAINING_TIME_L"],  # Base register, but we'll compute the value
+        extra_registries=_COUNTDOWN_REGISTRIES,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:fan-plus",
     ),
@@ -248,6 +267,7 @@ ENTITY_DESCRIPTIONS = (
         key="countdown_fireplace",
         translation_key="countdown_fireplace",
         registry=parameter_map["REG_USERMODE_REMAINING_TIME_L"],  # Base register, but we'll compute the value
+        extra_registries=_COUNTDOWN_REGISTRIES,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:fireplace",
     ),
@@ -255,6 +275,7 @@ ENTITY_DESCRIPTIONS = (
         key="countdown_holiday",
         translation_key="countdown_holiday",
         registry=parameter_map["REG_USERMODE_REMAINING_TIME_L"],  # Base register, but we'll compute the value
+        extra_registries=_COUNTDOWN_REGISTRIES,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:bag-suitcase",
     ),
@@ -272,18 +293,40 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+def extra_register_descriptions(shorts: Iterable[str]) -> tuple[SystemairSensorEntityDescription, ...]:
+    """Return a sensor for each register of registers.json enabled in the options, unknown names are skipped."""
+    return tuple(
+        SystemairSensorEntityDescription(
+            key=f"register_{param.short.lower()}",
+            name=param.description,
+            registry=param,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+        for short in shorts
+        if (param := parameter_map.get(short)) is not None
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: SystemairConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    entity_descriptions = (
+        *ENTITY_DESCRIPTIONS,
+        *extra_register_descriptions(entry.options.get(CONF_EXTRA_REGISTERS, ())),
+    )
+    entry.runtime_data.coordinator.register_modbus_parameters(
+        *(param for entity_description in entity_descriptions for param in entity_description.registries)
+    )
     async_add_entities(
         SystemairSensor(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
-        for entity_description in ENTITY_DESCRIPTIONS
+        for entity_description in entity_descriptions
+        if entry.runtime_data.coordinator.supports_parameters(entity_description.registry)
     )
 
 
@@ -303,6 +346,7 @@ class SystemairSensor(SystemairEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{entity_description.key}"
+        self._registers = frozenset(param.short for param in entity_description.registries)
 
     @property
     def native_value(self) -> str | None:
@@ -0,0 +1,72 @@
+"""Decoded register snapshot for Systemair."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from .modbus import IntegerType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .modbus import ModbusParameter
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterSnapshot:
+    """Decoded register values from one poll, indexed by parameter short name."""
+
+    raw: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    decoded: Mapping[str, float | bool] = field(default_factory=lambda: MappingProxyType({}))
+
+    def __contains__(self, parameter: ModbusParameter) -> bool:
+        """Return whether the snapshot holds a value for the parameter."""
+        return parameter.short in self.decoded
+
+    def get(self, parameter: ModbusParameter, default: Any = None) -> Any:
+        """Return the decoded value of the parameter."""
+        return self.decoded.get(parameter.short, default)
+
+
+def decode_value(parameter: ModbusParameter, raw: Mapping[str, Any]) -> float | bool | None:
+    """Decode the raw mread data of a single parameter, None if it is missing."""
+    value = raw.get(str(parameter.register - 1))
+    if value is None:
+        return None
+
+    if parameter.boolean:
+        return value != 0
+
+    value = int(value)
+
+    if parameter.combine_with_32_bit:
+        high = raw.get(str(parameter.combine_with_32_bit - 1))
+        if high is None:
+            return None
+        value += int(high) << 16
+
+    if parameter.sig == IntegerType.INT and value > (1 << 15):
+        value = -(65536 - value)
+    return value / (parameter.scale_factor or 1)
+
+
+def decode_snapshot(parameters: Iterable[ModbusParameter], raw: Mapping[str, Any]) -> RegisterSnapshot:
+    """Decode the raw mread data of all parameters into an immutable snapshot."""
+    values = {}
+    for parameter in parameters:
+        value = decode_value(parameter, raw)
+        if value is not None:
+            values[parameter.short] = value
+    return RegisterSnapshot(raw=MappingProxyType(dict(raw)), decoded=MappingProxyType(values))
+
+
+def diff_snapshots(old: RegisterSnapshot | None, new: RegisterSnapshot) -> frozenset[str]:
+    """Return the short names of the parameters whose decoded value differs between two snapshots."""
+    if old is None:
+        return frozenset(new.decoded)
+    old_values, new_values = old.decoded, new.decoded
+    return frozenset(
+        short for short in old_values.keys() | new_values.keys() if old_values.get(short) != new_values.get(short)
+    )
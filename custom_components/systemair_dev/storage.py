@@ -0,0 +1,169 @@
+"""Persistent storage for Systemair."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+DEVICE_METADATA_STORAGE_KEY = f"{DOMAIN}.device_metadata"
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+REGISTER_PROFILE_STORAGE_KEY = f"{DOMAIN}.register_profiles"
+
+# Fields of the /menu and /unit_version responses that identify the gateway, the unit and its
+# firmware. Other fields such as uptime or signal strength change between requests and are not kept.
+MENU_FIELDS = ("mac",)
+UNIT_VERSION_FIELDS = ("MB Model", "MB HW version", "MB SW version", "IAM SW version", "System Serial Number")
+
+
+class DeviceMetadataStore:
+    """
+    Cache of the identifying /menu and /unit_version fields of every known gateway.
+
+    Entries are keyed by MAC address and hold the serial number of the unit behind the gateway.
+    Only the gateway can tell that its unit was swapped, so the cached entry is used until the
+    background refresh returns another serial number. The entry is then invalidated together
+    with the snapshot of the old unit and the config entry reloads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, DEVICE_METADATA_STORAGE_KEY)
+        self._devices: dict[str, dict[str, Any]] | None = None
+
+    async def _async_load(self) -> dict[str, dict[str, Any]]:
+        """Load the stored metadata once."""
+        if self._devices is None:
+            self._devices = await self._store.async_load() or {}
+        return self._devices
+
+    async def async_get(self, mac_address: str) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Return the cached menu and unit_version responses of a gateway."""
+        device = (await self._async_load()).get(mac_address)
+        if device is None:
+            return None
+        return device["menu"], device["unit_version"]
+
+    async def async_invalidate(self, mac_address: str) -> None:
+        """Drop the cached entry of a gateway."""
+        devices = await self._async_load()
+        if devices.pop(mac_address, None) is not None:
+            await self._store.async_save(devices)
+
+    async def async_set(self, menu: dict[str, Any], unit_version: dict[str, Any]) -> bool:
+        """Store the identifying fields of the menu and unit_version responses, returns whether they changed."""
+        devices = await self._async_load()
+        device = {
+            "serial_number": unit_version["System Serial Number"],
+            "menu": {field: menu[field] for field in MENU_FIELDS},
+            "unit_version": {field: unit_version[field] for field in UNIT_VERSION_FIELDS},
+        }
+        if devices.get(menu["mac"]) == device:
+            return False
+        devices[menu["mac"]] = device
+        await self._store.async_save(devices)
+        return True
+
+
+class RegisterProfileStore:
+    """Addresses found to return data on each unit, keyed by serial number and valid for one MB SW version."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, REGISTER_PROFILE_STORAGE_KEY)
+        self._profiles: dict[str, dict[str, Any]] | None = None
+
+    async def _async_load(self) -> dict[str, dict[str, Any]]:
+        """Load the stored profiles once."""
+        if self._profiles is None:
+            self._profiles = await self._store.async_load() or {}
+        return self._profiles
+
+    async def async_get(self, serial_number: str, mb_sw_version: str) -> frozenset[int] | None:
+        """Return the supported addresses of a unit, None if it was not probed with this firmware."""
+        profile = (await self._async_load()).get(serial_number)
+        if profile is None or profile["mb_sw_version"] != mb_sw_version:
+            return None
+        return frozenset(profile["supported"])
+
+    async def async_set(self, serial_number: str, mb_sw_version: str, supported: frozenset[int]) -> None:
+        """Store the supported addresses of a unit."""
+        profiles = await self._async_load()
+        profiles[serial_number] = {"mb_sw_version": mb_sw_version, "supported": sorted(supported)}
+        await self._store.async_save(profiles)
+
+
+def get_register_profile_store(hass: HomeAssistant) -> RegisterProfileStore:
+    """Return the register profile store shared by all config entries."""
+    hass.data.setdefault(DOMAIN, {})
+    if (store := hass.data[DOMAIN].get(REGISTER_PROFILE_STORAGE_KEY)) is None:
+        store = hass.data[DOMAIN][REGISTER_PROFILE_STORAGE_KEY] = RegisterProfileStore(hass)
+    return store
+
+
+def get_device_metadata_store(hass: HomeAssistant) -> DeviceMetadataStore:
+    """Return the device metadata store shared by all config entries."""
+    hass.data.setdefault(DOMAIN, {})
+    if (store := hass.data[DOMAIN].get(DEVICE_METADATA_STORAGE_KEY)) is None:
+        store = hass.data[DOMAIN][DEVICE_METADATA_STORAGE_KEY] = DeviceMetadataStore(hass)
+    return store
+
+
+class SnapshotStore:
+    """
+    Last raw register data of a config entry, restored to bring entities up before the first poll.
+
+    Saves are throttled rather than debounced: the first update after a save schedules the next
+    one SNAPSHOT_SAVE_INTERVAL later and the updates until then only replace the data it writes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry_id}")
+        self._raw: Mapping[str, Any] | None = None
+        self._save_scheduled = False
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the stored raw register data."""
+        stored = await self._store.async_load()
+        return stored["raw"] if stored else None
+
+    def async_schedule_save(self, raw: Mapping[str, Any]) -> None:
+        """Save the raw register data with the next scheduled save, scheduling one if none is pending."""
+        self._raw = raw
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_INTERVAL)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the latest raw register data, called by the store when it writes."""
+        self._save_scheduled = False
+        return {"raw": dict(self._raw or {})}
+
+    async def async_flush(self) -> None:
+        """Write a pending save now."""
+        if self._save_scheduled:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Remove the stored data and drop a pending save."""
+        self._save_scheduled = False
+        self._raw = None
+        await self._store.async_remove()
+
+
+def get_snapshot_store(hass: HomeAssistant, entry_id: str) -> SnapshotStore:
+    """Return the snapshot store of a config entry, kept across reloads of the entry."""
+    hass.data.setdefault(DOMAIN, {})
+    key = f"{SNAPSHOT_STORAGE_KEY}.{entry_id}"
+    if (store := hass.data[DOMAIN].get(key)) is None:
+        store = hass.data[DOMAIN][key] = SnapshotStore(hass, entry_id)
+    return store
@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 
-from .entity import SystemairEntity
-from .modbus import ModbusParameter, parameter_map
+from .entity import SystemairEntity, SystemairEntityDescription
+from .modbus import parameter_map
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -19,11 +19,9 @@ if TYPE_CHECKING:
 
 
 @dataclass(kw_only=True, frozen=True)
-class SystemairSwitchEntityDescription(SwitchEntityDescription):
+class SystemairSwitchEntityDescription(SwitchEntityDescription, SystemairEntityDescription):
     """Describes a Systemair sensor entity."""
 
-    registry: ModbusParameter
-
 
 ENTITY_DESCRIPTIONS = (
     SystemairSwitchEntityDescription(
@@ -47,12 +45,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
+    entry.runtime_data.coordinator.register_modbus_parameters(
+        *(param for entity_description in ENTITY_DESCRIPTIONS for param in entity_description.registries)
+    )
     async_add_entities(
         SystemairSwitch(
             coordinator=entry.runtime_data.coordinator,
             entity_description=entity_description,
         )
         for entity_description in ENTITY_DESCRIPTIONS
+        if entry.runtime_data.coordinator.supports_parameters(entity_description.registry)
     )
 
 
@@ -72,6 +74,7 @@ class SystemairSwitch(SystemairEntity, SwitchEntity):
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{entity_description.key}"
+        self._registers = frozenset(param.short for param in entity_description.registries)
 
     @property
     def is_on(self) -> bool:
@@ -81,9 +84,7 @@ class SystemairSwitch(SystemairEntity, SwitchEntity):
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the switch."""
         await self.coordinator.set_modbus_data(self.entity_description.registry, value=True)
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the switch."""
         await self.coordinator.set_modbus_data(self.entity_description.registry, value=False)
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,257 @@
+"""
+Poll-cycle benchmark for the Systemair integration.
+
+Drives the hot path of a poll against the local gateway simulator: building the mread
+request, parsing the gateway response, decoding the snapshot and evaluating the state of
+every entity of every platform. Results are compared against a stored baseline and the
+script exits non-zero when a metric regresses past its threshold.
+
+    python scripts/benchmark.py                                   # compare against the baseline
+    python scripts/benchmark.py --update-baseline                 # store the traffic metrics
+    python scripts/benchmark.py --update-baseline --with-timings  # also store the timings
+
+The committed baseline only holds the traffic metrics, which are the same on every machine.
+Timings depend on the machine, only store them in a baseline that stays on the same one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from simulator import SaveConnectSimulator, SimulatorConfig
+
+from custom_components.systemair_dev.api import SystemairApiClient, create_gateway_session
+from custom_components.systemair_dev.binary_sensor import ENTITY_DESCRIPTIONS as BINARY_SENSOR_DESCRIPTIONS
+from custom_components.systemair_dev.binary_sensor import SystemairBinarySensor
+from custom_components.systemair_dev.climate import SystemairClimateEntity
+from custom_components.systemair_dev.const import DOMAIN
+from custom_components.systemair_dev.coordinator import SystemairDataUpdateCoordinator
+from custom_components.systemair_dev.data import SystemairData
+from custom_components.systemair_dev.modbus import REQUIRED_PARAMETERS
+from custom_components.systemair_dev.number import NUMBERS, SystemairNumber
+from custom_components.systemair_dev.planner import build_read_plan
+from custom_components.systemair_dev.sensor import ENTITY_DESCRIPTIONS as SENSOR_DESCRIPTIONS
+from custom_components.systemair_dev.sensor import SystemairSensor
+from custom_components.systemair_dev.snapshot import decode_snapshot
+from custom_components.systemair_dev.switch import ENTITY_DESCRIPTIONS as SWITCH_DESCRIPTIONS
+from custom_components.systemair_dev.switch import SystemairSwitch
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_components.systemair_dev.entity import SystemairEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+
+# Largest allowed ratio between the current result and the baseline, per metric
+THRESHOLDS = {
+    "url_build_us": 1.25,
+    "response_parse_us": 1.25,
+    "decode_us": 1.25,
+    "entity_states_us": 1.25,
+    "poll_cycle_ms": 1.25,
+    "poll_cycle_peak_kib": 1.10,
+    "requests_per_cycle": 1.0,
+    "bytes_per_cycle": 1.05,
+}
+
+# Metrics that do not depend on the machine running the benchmark
+TRAFFIC_METRICS = ("requests_per_cycle", "bytes_per_cycle")
+
+STATE_PROPERTIES: dict[type, tuple[str, ...]] = {
+    SystemairSensor: ("native_value",),
+    SystemairBinarySensor: ("is_on",),
+    SystemairSwitch: ("is_on",),
+    SystemairNumber: ("native_value",),
+    SystemairClimateEntity: (
+        "hvac_action",
+        "current_humidity",
+        "current_temperature",
+        "target_temperature",
+        "preset_mode",
+        "hvac_mode",
+        "fan_mode",
+    ),
+}
+
+
+class _RecordedResponse:
+    """Replays a recorded gateway response body to the client parser."""
+
+    status = 200
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize with the recorded body."""
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return self._body.decode()
+
+    async def json(self) -> Any:
+        """Return the body decoded as JSON."""
+        return json.loads(self._body)
+
+
+def _create_entities(coordinator: SystemairDataUpdateCoordinator) -> list[SystemairEntity]:
+    """Create every entity of every platform."""
+    return [
+        SystemairClimateEntity(coordinator),
+        *(SystemairSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS),
+        *(SystemairBinarySensor(coordinator, description) for description in BINARY_SENSOR_DESCRIPTIONS),
+        *(SystemairSwitch(coordinator, description) for description in SWITCH_DESCRIPTIONS),
+        *(SystemairNumber(coordinator, description) for description in NUMBERS),
+    ]
+
+
+def _evaluate_states(entities: list[SystemairEntity]) -> list[Any]:
+    """Evaluate the state properties Home Assistant reads when writing entity state."""
+    return [getattr(entity, name) for entity in entities for name in STATE_PROPERTIES[type(entity)]]
+
+
+def _measure(func: Callable[[], Any], iterations: int) -> float:
+    """Return the median duration of func in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+async def _measure_async(func: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    """Return the median duration of an async func in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+async def run_benchmark(iterations: int, model: str) -> dict[str, float]:
+    """Run all benchmarks and return the results."""
+    simulator = SaveConnectSimulator(SimulatorConfig(model=model, latency=0, transaction_cost=0))
+    address = await simulator.start()
+    hass = HomeAssistant(tempfile.mkdtemp())
+    results: dict[str, float] = {}
+
+    try:
+        async with create_gateway_session() as session:
+            client = SystemairApiClient(address, session, request_rate=1e6, request_burst=1_000_000)
+            coordinator = SystemairDataUpdateCoordinator(hass)
+            coordinator.config_entry = SimpleNamespace(
+                entry_id="benchmark",
+                domain=DOMAIN,
+                runtime_data=SystemairData(client=client, coordinator=coordinator, integration=None, mb_model=model),
+            )
+            coordinator.register_modbus_parameters(*REQUIRED_PARAMETERS)
+            coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+            entities = _create_entities(coordinator)
+            parameters = list(coordinator.modbus_parameters)
+
+            plan = build_read_plan(parameters)
+            async with session.get(f"http://{address}/mread?{{{plan.query}}}") as response:
+                body = await response.read()
+
+            results["url_build_us"] = _measure(
+                lambda: client._read_request(parameters, frozenset(param.register - 1 for param in parameters)),  # noqa: SLF001
+                iterations,
+            )
+            results["response_parse_us"] = await _measure_async(
+                lambda: client._parse_response(_RecordedResponse(body), retry=False),  # noqa: SLF001
+                iterations,
+            )
+            results["decode_us"] = _measure(lambda: decode_snapshot(parameters, coordinator.data.raw), iterations)
+            results["entity_states_us"] = _measure(lambda: _evaluate_states(entities), iterations)
+
+            async def _poll_cycle() -> None:
+                coordinator._next_poll.clear()  # noqa: SLF001
+                coordinator.data = await coordinator._async_update_data()  # noqa: SLF001
+                _evaluate_states(entities)
+
+            simulator.reset_stats()
+            results["poll_cycle_ms"] = await _measure_async(_poll_cycle, iterations) / 1000
+            results["requests_per_cycle"] = simulator.stats.requests / iterations
+            results["bytes_per_cycle"] = (simulator.stats.bytes_in + simulator.stats.bytes_out) / iterations
+
+            tracemalloc.start()
+            await _poll_cycle()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results["poll_cycle_peak_kib"] = peak / 1024
+    finally:
+        await simulator.stop()
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float]) -> list[str]:
+    """Return a description of every metric that regressed past its threshold."""
+    regressions = []
+    for metric, threshold in THRESHOLDS.items():
+        if metric not in baseline or metric not in results or baseline[metric] <= 0:
+            continue
+        ratio = results[metric] / baseline[metric]
+        if ratio > threshold:
+            regressions.append(
+                f"{metric}: {results[metric]:.2f} vs baseline {baseline[metric]:.2f} "
+                f"({ratio:.2f}x, threshold {threshold:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark and compare it against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--model", default="VTR-300")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--with-timings", action="store_true", help="store the timings in the baseline too")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = asyncio.run(run_benchmark(args.iterations, args.model))
+    for metric, value in results.items():
+        _LOGGER.info("%-22s %12.2f", metric, value)
+
+    if args.update_baseline:
+        baseline = results if args.with_timings else {metric: results[metric] for metric in TRAFFIC_METRICS}
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        _LOGGER.info("Baseline written to %s", args.baseline)
+        return 0
+
+    if not args.baseline.exists():
+        _LOGGER.warning("No baseline at %s, run with --update-baseline to create one", args.baseline)
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()))
+    for regression in regressions:
+        _LOGGER.error("Regression: %s", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
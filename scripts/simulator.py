@@ -0,0 +1,311 @@
+"""
+Local SAVE Connect gateway simulator.
+
+Serves /mread, /mwrite, /menu and /unit_version from an in-memory register file so the
+API client and coordinator can be exercised and benchmarked without a ventilation unit.
+
+    python scripts/simulator.py --model VTR-300 --port 8080
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.systemair_dev.modbus import (
+    IntegerType,
+    ModbusParameter,
+    parameter_map,
+    parameters_list,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Raw register values (before scaling) that differ from zero, per model
+_COMMON_VALUES = {
+    "REG_DEMC_RH_HIGHEST": 45,
+    "REG_USERMODE_HOLIDAY_TIME": 7,
+    "REG_USERMODE_AWAY_TIME": 24,
+    "REG_USERMODE_FIREPLACE_TIME": 10,
+    "REG_USERMODE_REFRESH_TIME": 60,
+    "REG_USERMODE_CROWDED_TIME": 4,
+    "REG_USERMODE_CROWDED_AIRFLOW_LEVEL_SAF": 4,
+    "REG_USERMODE_CROWDED_AIRFLOW_LEVEL_EAF": 4,
+    "REG_USERMODE_REFRESH_AIRFLOW_LEVEL_SAF": 5,
+    "REG_USERMODE_REFRESH_AIRFLOW_LEVEL_EAF": 5,
+    "REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_SAF": 4,
+    "REG_USERMODE_FIREPLACE_AIRFLOW_LEVEL_EAF": 2,
+    "REG_USERMODE_AWAY_AIRFLOW_LEVEL_SAF": 2,
+    "REG_USERMODE_AWAY_AIRFLOW_LEVEL_EAF": 2,
+    "REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_SAF": 1,
+    "REG_USERMODE_HOLIDAY_AIRFLOW_LEVEL_EAF": 1,
+    "REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_SAF": 3,
+    "REG_USERMODE_COOKERHOOD_AIRFLOW_LEVEL_EAF": 2,
+    "REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_SAF": 3,
+    "REG_USERMODE_VACUUMCLEANER_AIRFLOW_LEVEL_EAF": 4,
+    "REG_USERMODE_MODE": 1,
+    "REG_SENSOR_RPM_SAF": 1850,
+    "REG_SENSOR_RPM_EAF": 1790,
+    "REG_USERMODE_MANUAL_AIRFLOW_LEVEL_SAF": 3,
+    "REG_USERMODE_MANUAL_COMMAND": 3,
+    "REG_OUTPUT_SAF": 45,
+    "REG_OUTPUT_EAF": 43,
+    "REG_OUTPUT_SAF_POWER_FACTOR": 45,
+    "REG_TC_SP": 200,
+    "REG_ECO_HEAT_OFFSET": 30,
+    "REG_FILTER_REMAINING_TIME_L": 0x2000,
+    "REG_FILTER_REMAINING_TIME_H": 0x00EA,
+    "REG_FILTER_REPLACEMENT_PERIOD": 12,
+    "REG_MOISTURE_EXTRACTION_SP": 45,
+    "REG_SENSOR_OAT": 65486,  # -5.0 C as unsigned 16-bit
+    "REG_SENSOR_SAT": 195,
+    "REG_SENSOR_EAT": 215,
+    "REG_SENSOR_OHT": 220,
+    "REG_SENSOR_RHS": 38,
+    "REG_SENSOR_PDM_EAT_VALUE": 214,
+    "REG_SENSOR_RHS_PDM": 37,
+    "REG_SENSOR_EFFICIENCY_TEMP": 170,
+    "REG_SENSOR_OHT_ALT": 220,
+    "REG_SENSOR_CALC_MOISTURE_EXTRACTION": 35,
+    "REG_SENSOR_CALC_MOISTURE_INTAKE": 30,
+    "REG_OUTPUT_Y2_DIGITAL": 1,
+}
+
+MODEL_PROFILES: dict[str, dict[str, Any]] = {
+    "VTR-300": {
+        "values": {**_COMMON_VALUES, "REG_FUNCTION_ACTIVE_HEATER": 1},
+        "missing": set(),
+    },
+    "VTR-500": {
+        "values": {
+            **_COMMON_VALUES,
+            "REG_FUNCTION_ACTIVE_HEATER": 1,
+            "REG_OUTPUT_TRIAC": 1,
+            "REG_PWM_TRIAC_OUTPUT": 35,
+        },
+        "missing": set(),
+    },
+    "VSR-300": {
+        "values": {**_COMMON_VALUES, "REG_FUNCTION_ACTIVE_HEATER": 0},
+        # Not taken from a real unit, these exercise the register probe and the per-model entity filtering
+        "missing": {
+            "REG_OUTPUT_SAF_POWER_FACTOR",
+            "REG_OUTPUT_Y3_ANALOG",
+            "REG_OUTPUT_Y3_DIGITAL",
+            "REG_SENSOR_CALC_MOISTURE_EXTRACTION",
+            "REG_SENSOR_CALC_MOISTURE_INTAKE",
+        },
+    },
+}
+
+
+@dataclass(kw_only=True)
+class SimulatorConfig:
+    """Behaviour of the simulated gateway."""
+
+    model: str = "VTR-300"
+    # Fixed latency of every HTTP request, in seconds
+    latency: float = 0.02
+    # Cost of every Modbus transaction (one per mread/mwrite entry), in seconds
+    transaction_cost: float = 0.01
+    # Longest request target the firmware accepts, longer requests get HTTP 414
+    max_url_length: int = 2048
+    # Probability that a request is answered with MB DISCONNECTED
+    disconnect_rate: float = 0.0
+    # Delay before a user mode change request takes effect, in seconds
+    mode_switch_delay: float = 0.3
+
+
+@dataclass
+class SimulatorStats:
+    """Counters of the traffic seen by the simulator."""
+
+    requests: int = 0
+    transactions: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    disconnects: int = 0
+    endpoints: dict[str, int] = field(default_factory=dict)
+
+
+class SaveConnectSimulator:
+    """In-memory SAVE Connect gateway."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        """Initialize the simulator with the register file of the configured model."""
+        self.config = config or SimulatorConfig()
+        self.stats = SimulatorStats()
+        self.registers: dict[int, int] = {}
+        self._bus = asyncio.Lock()
+        self._disconnect_next = 0
+        self._runner: web.AppRunner | None = None
+        self.reset_registers()
+
+    def reset_registers(self) -> None:
+        """Seed the register file from the model profile."""
+        profile = MODEL_PROFILES[self.config.model]
+        self.registers = {
+            param.register - 1: profile["values"].get(param.short, 0)
+            for param in parameters_list
+            if param.short not in profile["missing"]
+        }
+
+    def reset_stats(self) -> None:
+        """Clear the traffic counters."""
+        self.stats = SimulatorStats()
+
+    def inject_disconnects(self, count: int) -> None:
+        """Answer the next count requests with MB DISCONNECTED."""
+        self._disconnect_next += count
+
+    def set_value(self, parameter: ModbusParameter, value: float) -> None:
+        """Set the scaled value of a parameter, as the unit itself would."""
+        raw = round(value * (parameter.scale_factor or 1))
+        if parameter.sig == IntegerType.INT and raw < 0:
+            raw += 65536
+        self.registers[parameter.register - 1] = raw
+
+    def make_app(self) -> web.Application:
+        """Create the aiohttp application serving the gateway endpoints."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/mread", self._handle_mread)
+        app.router.add_get("/mwrite", self._handle_mwrite)
+        app.router.add_get("/menu", self._handle_menu)
+        app.router.add_get("/unit_version", self._handle_unit_version)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, return the address to hand to SystemairApiClient."""
+        self._runner = web.AppRunner(self.make_app(), max_line_size=65536)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # noqa: SLF001
+        return f"{host}:{sockets[0].getsockname()[1]}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Account for traffic, latency, URL length limits and injected disconnects."""
+        self.stats.requests += 1
+        self.stats.bytes_in += len(request.raw_path)
+        self.stats.endpoints[request.path] = self.stats.endpoints.get(request.path, 0) + 1
+        await asyncio.sleep(self.config.latency)
+
+        if len(request.raw_path) > self.config.max_url_length:
+            response: web.StreamResponse = web.Response(status=414, text="URI Too Long")
+        elif self._disconnect_next > 0 or random.random() < self.config.disconnect_rate:  # noqa: S311
+            self._disconnect_next = max(0, self._disconnect_next - 1)
+            self.stats.disconnects += 1
+            response = web.Response(text="MB DISCONNECTED")
+        else:
+            response = await handler(request)
+
+        if isinstance(response, web.Response) and response.body is not None:
+            self.stats.bytes_out += len(response.body)
+        return response
+
+    def _query(self, request: web.Request) -> dict[str, int]:
+        """Decode the JSON object passed as query string."""
+        return json.loads(unquote(request.query_string) or "{}")
+
+    async def _transactions(self, count: int) -> None:
+        """Hold the Modbus bus for the given number of transactions."""
+        async with self._bus:
+            self.stats.transactions += count
+            await asyncio.sleep(self.config.transaction_cost * count)
+
+    async def _handle_mread(self, request: web.Request) -> web.Response:
+        """Read single registers or ranges."""
+        query = self._query(request)
+        await self._transactions(len(query))
+        response: dict[str, Any] = {}
+        for key, count in query.items():
+            start = int(key)
+            if count == 1:
+                if start in self.registers:
+                    response[key] = self.registers[start]
+            else:
+                response[key] = [self.registers.get(address) for address in range(start, start + count)]
+        return web.json_response(response)
+
+    async def _handle_mwrite(self, request: web.Request) -> web.Response:
+        """Write registers."""
+        query = self._query(request)
+        await self._transactions(len(query))
+        for key, value in query.items():
+            address = int(key)
+            if address not in self.registers:
+                return web.Response(text="ERROR")
+            self.registers[address] = value
+            if address == parameter_map["REG_USERMODE_HMI_CHANGE_REQUEST"].register - 1 and value:
+                asyncio.get_running_loop().call_later(self.config.mode_switch_delay, self._apply_mode_change, value)
+        return web.Response(text="OK")
+
+    def _apply_mode_change(self, request: int) -> None:
+        """Switch the user mode like the unit does after an HMI change request."""
+        self.registers[parameter_map["REG_USERMODE_MODE"].register - 1] = request - 1
+        self.registers[parameter_map["REG_USERMODE_HMI_CHANGE_REQUEST"].register - 1] = 0
+
+    async def _handle_menu(self, _request: web.Request) -> web.Response:
+        """Return the gateway menu."""
+        return web.json_response({"mac": "00:11:22:33:44:55", "version": "1.0"})
+
+    async def _handle_unit_version(self, _request: web.Request) -> web.Response:
+        """Return the unit version information."""
+        return web.json_response(
+            {
+                "MB Model": self.config.model,
+                "MB HW version": "1",
+                "MB SW version": "1.22.0",
+                "IAM SW version": "1.6.0",
+                "System Serial Number": f"SIM{self.config.model.replace('-', '')}0001",
+            }
+        )
+
+
+def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", choices=sorted(MODEL_PROFILES), default="VTR-300")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=SimulatorConfig.latency)
+    parser.add_argument("--transaction-cost", type=float, default=SimulatorConfig.transaction_cost)
+    parser.add_argument("--max-url-length", type=int, default=SimulatorConfig.max_url_length)
+    parser.add_argument("--disconnect-rate", type=float, default=SimulatorConfig.disconnect_rate)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    simulator = SaveConnectSimulator(
+        SimulatorConfig(
+            model=args.model,
+            latency=args.latency,
+            transaction_cost=args.transaction_cost,
+            max_url_length=args.max_url_length,
+            disconnect_rate=args.disconnect_rate,
+        )
+    )
+    _LOGGER.info("Simulating %s on http://%s:%s", args.model, args.host, args.port)
+    web.run_app(simulator.make_app(), host=args.host, port=args.port, handler_args={"max_line_size": 65536})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Shared test setup."""
+
+# Importing the integration package first runs into a circular import inside homeassistant
+import homeassistant.core  # noqa: F401
@@ -0,0 +1,93 @@
+"""Tests for the mread read planner."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.systemair_dev.planner import MAX_RANGE_COUNT, ReadPlan, ReadRange, build_read_plan
+
+
+def _parameters(*registers: int) -> list[SimpleNamespace]:
+    """Return stand-in parameters for the given 1-based registers."""
+    return [SimpleNamespace(register=register) for register in registers]
+
+
+def test_close_registers_are_coalesced() -> None:
+    """Registers within max_gap of each other are read as one range."""
+    plan = build_read_plan(_parameters(101, 103, 110, 200), max_gap=10)
+
+    assert plan.ranges == (ReadRange(start=100, count=10), ReadRange(start=199, count=1))
+    assert plan.addresses == frozenset({100, 102, 109, 199})
+
+
+def test_gap_above_max_gap_starts_new_range() -> None:
+    """A gap wider than max_gap is not bridged."""
+    plan = build_read_plan(_parameters(101, 104), max_gap=1)
+
+    assert plan.ranges == (ReadRange(start=100, count=1), ReadRange(start=103, count=1))
+
+
+def test_ranges_are_capped_at_max_range_count() -> None:
+    """A range never reads more registers than a single Modbus read returns."""
+    plan = build_read_plan(_parameters(*range(1, MAX_RANGE_COUNT + 11)))
+
+    assert plan.ranges == (ReadRange(start=0, count=MAX_RANGE_COUNT), ReadRange(start=MAX_RANGE_COUNT, count=10))
+
+
+def test_gap_is_not_bridged_across_unavailable_address() -> None:
+    """An address the unit does not implement splits the range around it."""
+    parameters = _parameters(101, 105, 110)
+
+    assert build_read_plan(parameters, unavailable=frozenset({102})).ranges == (
+        ReadRange(start=100, count=1),
+        ReadRange(start=104, count=6),
+    )
+    assert build_read_plan(parameters, unavailable=frozenset({99, 120})).ranges == (ReadRange(start=100, count=10),)
+
+
+def test_query() -> None:
+    """The query holds one url encoded entry per range."""
+    plan = ReadPlan(ranges=(ReadRange(start=100, count=3), ReadRange(start=200, count=1)), addresses=frozenset())
+
+    assert plan.query == "%22100%22:3,%22200%22:1"
+
+
+def test_chunk_and_split_round_trip() -> None:
+    """Splitting the responses of all chunks returns every requested register once."""
+    plan = build_read_plan(_parameters(*range(1, 301, 3)), max_gap=10)
+    chunks = plan.chunk(max_query_length=40, max_registers=50)
+
+    assert len(chunks) > 1
+    assert all(len(chunk.query) <= 40 for chunk in chunks)  # noqa: PLR2004
+    assert all(sum(item.count for item in chunk.ranges) <= 50 for chunk in chunks)  # noqa: PLR2004
+
+    data = {}
+    for chunk in chunks:
+        response = {str(item.start): [address * 2 for address in range(item.start, item.stop)] for item in chunk.ranges}
+        data.update(chunk.split(response))
+
+    assert data == {str(address): address * 2 for address in plan.addresses}
+
+
+def test_chunk_keeps_plan_that_fits() -> None:
+    """A plan within the limits is returned as is."""
+    plan = build_read_plan(_parameters(1, 2, 3))
+
+    assert plan.chunk(max_query_length=2048) == (plan,)
+
+
+def test_split_handles_single_values_and_missing_registers() -> None:
+    """Single register reads answer a plain value, registers the unit does not have are left out."""
+    plan = ReadPlan(
+        ranges=(ReadRange(start=100, count=3), ReadRange(start=200, count=1), ReadRange(start=300, count=1)),
+        addresses=frozenset({100, 102, 200, 300}),
+    )
+
+    assert plan.split({"100": [1, 2, None], "200": 7}) == {"100": 1, "102": None, "200": 7}
+
+
+def test_split_handles_one_key_per_address() -> None:
+    """Firmware answering a range with one key per address is split the same way."""
+    plan = ReadPlan(ranges=(ReadRange(start=100, count=3),), addresses=frozenset({100, 102}))
+
+    assert plan.split({"100": 1, "101": 2, "102": 3}) == {"100": 1, "102": 3}
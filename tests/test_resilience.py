@@ -0,0 +1,128 @@
+"""Tests for the circuit breaker, retry policies and latency based timeouts."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from custom_components.systemair_dev.resilience import (
+    DEFAULT_TIMEOUT,
+    LATENCY_MIN_SAMPLES,
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
+    CircuitBreaker,
+    CircuitState,
+    LatencyTracker,
+    RetryPolicy,
+)
+
+
+class _Clock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Replace time.monotonic with a clock controlled by the test."""
+    clock = _Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def _open(breaker: CircuitBreaker, failures: int = 3) -> None:
+    """Record enough failures to open a closed circuit."""
+    for _ in range(failures):
+        breaker.record_failure()
+
+
+def test_circuit_opens_at_threshold(clock: _Clock) -> None:
+    """The circuit stays closed until failure_threshold consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3, open_duration=10)
+
+    _open(breaker, 2)
+    assert breaker.state is CircuitState.Closed
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.Open
+    assert breaker.open_duration == 10  # noqa: PLR2004
+    assert not breaker.probe_due
+    assert 8 <= breaker.retry_in <= 12  # noqa: PLR2004
+
+    clock.now += 12
+    assert breaker.probe_due
+    assert breaker.retry_in == 0
+
+
+def test_success_resets_failures() -> None:
+    """A success in between restarts the count of consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    _open(breaker, 2)
+    breaker.record_success()
+    _open(breaker, 2)
+
+    assert breaker.state is CircuitState.Closed
+    assert breaker.failures == 2  # noqa: PLR2004
+
+
+def test_successful_probe_closes_circuit(clock: _Clock) -> None:
+    """A successful probe closes the circuit and resets the open duration."""
+    breaker = CircuitBreaker(failure_threshold=3, open_duration=10)
+    _open(breaker)
+    clock.now += 12
+
+    breaker.half_open()
+    assert breaker.state is CircuitState.HalfOpen
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.Closed
+    assert breaker.failures == 0
+    assert breaker.open_duration == 0
+
+
+def test_failed_probe_reopens_with_doubled_duration(clock: _Clock) -> None:
+    """A failed probe opens the circuit again for twice as long, up to max_open_duration."""
+    breaker = CircuitBreaker(failure_threshold=3, open_duration=10, max_open_duration=30)
+    _open(breaker)
+
+    durations = []
+    for _ in range(3):
+        clock.now += 100
+        breaker.half_open()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.Open
+        assert not breaker.probe_due
+        durations.append(breaker.open_duration)
+
+    assert durations == [20, 30, 30]
+
+
+def test_retry_delay_is_bounded() -> None:
+    """Backoff grows exponentially with jitter and never exceeds max_delay."""
+    policy = RetryPolicy(attempts=4, base_delay=0.5, max_delay=2.0)
+
+    for attempt, delay in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 2.0)):
+        assert delay / 2 <= policy.delay(attempt) <= delay
+
+
+def test_timeout_follows_measured_latency() -> None:
+    """The timeout is the default until enough samples exist and is clamped afterwards."""
+    tracker = LatencyTracker()
+    assert tracker.timeout == DEFAULT_TIMEOUT
+
+    for _ in range(LATENCY_MIN_SAMPLES):
+        tracker.record(0.01)
+    assert tracker.timeout == MIN_TIMEOUT
+
+    for _ in range(LATENCY_MIN_SAMPLES * 10):
+        tracker.record(60)
+    assert tracker.timeout == MAX_TIMEOUT
@@ -0,0 +1,74 @@
+"""Tests for decoding and diffing register snapshots."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from custom_components.systemair_dev.modbus import IntegerType, ModbusParameter, RegisterType
+from custom_components.systemair_dev.snapshot import RegisterSnapshot, decode_snapshot, diff_snapshots
+
+TEMPERATURE = ModbusParameter(
+    register=101,
+    sig=IntegerType.INT,
+    reg_type=RegisterType.Input,
+    short="REG_TEMPERATURE",
+    description="Temperature",
+    scale_factor=10,
+)
+SWITCH = ModbusParameter(
+    register=102,
+    sig=IntegerType.UINT,
+    reg_type=RegisterType.Holding,
+    short="REG_SWITCH",
+    description="Switch",
+    boolean=True,
+)
+COUNTER = ModbusParameter(
+    register=103,
+    sig=IntegerType.UINT,
+    reg_type=RegisterType.Input,
+    short="REG_COUNTER",
+    description="Counter",
+    combine_with_32_bit=104,
+)
+
+
+def _snapshot(**decoded: float | bool) -> RegisterSnapshot:
+    """Return a snapshot holding the given decoded values."""
+    return RegisterSnapshot(decoded=MappingProxyType(decoded))
+
+
+def test_decode_snapshot() -> None:
+    """Values are scaled, signed, combined to 32 bit and turned into booleans."""
+    snapshot = decode_snapshot([TEMPERATURE, SWITCH, COUNTER], {"100": 65526, "101": 1, "102": 5, "103": 2})
+
+    assert snapshot.get(TEMPERATURE) == -1.0
+    assert snapshot.get(SWITCH) is True
+    assert snapshot.get(COUNTER) == 5 + (2 << 16)
+
+
+def test_decode_snapshot_skips_missing_registers() -> None:
+    """Parameters without a value, or without the high word of a 32 bit value, are left out."""
+    snapshot = decode_snapshot([TEMPERATURE, SWITCH, COUNTER], {"100": None, "101": 0, "102": 5})
+
+    assert TEMPERATURE not in snapshot
+    assert COUNTER not in snapshot
+    assert snapshot.get(SWITCH) is False
+
+
+def test_diff_against_no_snapshot_returns_everything() -> None:
+    """The first snapshot changes every parameter it holds."""
+    assert diff_snapshots(None, _snapshot(a=1, b=2)) == frozenset({"a", "b"})
+
+
+def test_diff_returns_changed_parameters() -> None:
+    """Changed, added and removed values are reported, unchanged ones are not."""
+    old = _snapshot(same=1, changed=2, removed=3)
+    new = _snapshot(same=1, changed=4, added=5)
+
+    assert diff_snapshots(old, new) == frozenset({"changed", "removed", "added"})
+
+
+def test_diff_of_equal_snapshots_is_empty() -> None:
+    """Equal snapshots have no changes."""
+    assert diff_snapshots(_snapshot(a=1.5, b=True), _snapshot(a=1.5, b=True)) == frozenset()